@@ -0,0 +1,247 @@
+import contextlib
+import io
+import os
+import sys
+import time
+
+import numpy as np
+
+from parallel import chunk_ranges
+
+BLOCK_BYTES = 1 << 22  # bytes parsed at a time; temporaries run ~50x this
+MAX_DIGITS = 18  # anything longer would overflow int64
+POW10 = 10 ** np.arange(MAX_DIGITS + 1, dtype=np.int64)
+
+# Byte classes, looked up with one gather instead of several comparisons
+STRAY, DIGIT, SPACE, SIGN = 0, 1, 2, 3
+BYTE_CLASS = np.zeros(256, dtype=np.uint8)
+BYTE_CLASS[[ord(c) for c in "0123456789"]] = DIGIT
+BYTE_CLASS[[ord(c) for c in " \t\r\n\v\f"]] = SPACE
+BYTE_CLASS[[ord("-"), ord("+")]] = SIGN
+
+
+def iter_blocks(filename, block_bytes=BLOCK_BYTES):
+    """
+    Yield the file as uint8 arrays of about block_bytes each, split just
+    after a newline so every block holds whole reports.
+    """
+    size = os.path.getsize(filename)
+    for start, end in chunk_ranges(filename, -(-size // block_bytes)):
+        yield np.fromfile(filename, dtype=np.uint8, count=end - start, offset=start)
+
+
+def load_reports(filename):
+    """
+    Load a whole report file into a ragged array. See parse_reports; the
+    process_file_batch functions go block by block instead.
+    """
+    return parse_reports(np.fromfile(filename, dtype=np.uint8))
+
+
+def parse_reports(raw):
+    """
+    Parse report bytes into a ragged array.
+
+    Returns (values, token_line, total_lines, bad_lines) where values holds
+    every level of every report back to back, token_line[k] is the line
+    number (0-based) that values[k] came from, and bad_lines is a boolean
+    mask of lines that the per-line parser would reject with ValueError.
+    """
+    if raw.size == 0:
+        return np.zeros(0, np.int64), np.zeros(0, np.int64), 0, np.zeros(0, bool)
+
+    newline_pos = np.flatnonzero(raw == ord("\n"))
+    total_lines = newline_pos.size + (0 if raw[-1] == ord("\n") else 1)
+
+    cls = BYTE_CLASS[raw]
+    is_digit = cls == DIGIT
+    is_space = cls == SPACE
+
+    # A sign is only part of a number if it starts a token and a digit follows
+    good_sign = cls == SIGN
+    good_sign[1:] &= is_space[:-1]
+    good_sign[:-1] &= is_digit[1:]
+    good_sign[-1] = False
+
+    edges = np.flatnonzero(np.diff(is_digit.view(np.int8), prepend=0, append=0))
+    start_pos = edges[::2]
+    end_pos = edges[1::2] - 1
+    lengths = end_pos - start_pos + 1
+
+    # Digits glued to anything but whitespace or a leading sign, stray bytes,
+    # and numbers too long for int64 all make the line unparseable
+    stray = cls == STRAY
+    stray |= (cls == SIGN) & ~good_sign
+    inner_start = start_pos[start_pos > 0]
+    stray[inner_start[~(is_space[inner_start - 1] | good_sign[inner_start - 1])]] = True
+    inner_end = end_pos[end_pos < raw.size - 1]
+    stray[inner_end[~is_space[inner_end + 1]]] = True
+    stray[start_pos[lengths > MAX_DIGITS]] = True
+    bad_lines = np.zeros(total_lines, dtype=bool)
+    bad_lines[np.searchsorted(newline_pos, np.flatnonzero(stray))] = True
+
+    # Positional value of each digit within its token, then sum per token
+    digits = raw[is_digit] - ord("0")
+    token_offset = np.cumsum(lengths) - lengths
+    place = np.repeat(token_offset + lengths - 1, lengths) - np.arange(digits.size)
+    weighted = digits.astype(np.int64) * POW10[np.minimum(place, MAX_DIGITS)]
+    values = np.add.reduceat(weighted, token_offset) if lengths.size else weighted
+
+    negative = np.zeros(start_pos.size, dtype=bool)
+    has_prefix = start_pos > 0
+    negative[has_prefix] = raw[start_pos[has_prefix] - 1] == ord("-")
+    values[negative] *= -1
+
+    return values, np.searchsorted(newline_pos, start_pos), total_lines, bad_lines
+
+
+def _bad_steps(values, token_line, sign):
+    """
+    Global pair indices k (pair = values[k], values[k+1] on the same line)
+    whose step in direction `sign` is outside 1..3.
+    """
+    same_line = token_line[1:] == token_line[:-1]
+    step = (values[1:] - values[:-1]) * sign
+    return np.flatnonzero(same_line & ((step < 1) | (step > 3)))
+
+
+def _first_last_per_line(pair_idx, token_line, total_lines):
+    """
+    For each line, the first and last bad pair index (global), or -1.
+    pair_idx must be sorted, which np.flatnonzero guarantees.
+    """
+    first = np.full(total_lines, -1, dtype=np.int64)
+    last = np.full(total_lines, -1, dtype=np.int64)
+    if pair_idx.size:
+        lines = token_line[pair_idx]
+        new = np.concatenate(([True], lines[1:] != lines[:-1]))
+        end = np.concatenate((lines[1:] != lines[:-1], [True]))
+        first[lines[new]] = pair_idx[new]
+        last[lines[end]] = pair_idx[end]
+    return first, last
+
+
+def _one_removal_fixes(values, line_start, line_len, first, last, sign):
+    """
+    Vectorized counterpart of main2._removable_index: for every line with at
+    least one bad step in direction `sign`, decide whether a single removal
+    repairs it. Only indices in [last, first + 1] are candidates.
+    """
+    fixed = np.zeros(first.size, dtype=bool)
+    lines = np.flatnonzero(first >= 0)
+    if lines.size == 0:
+        return fixed
+
+    for offset in (0, 1):
+        cand = first[lines] + offset
+        in_range = cand >= last[lines]
+        local = cand - line_start[lines]
+        n = line_len[lines]
+        at_edge = (local == 0) | (local == n - 1)
+
+        inner = in_range & ~at_edge
+        bridge = np.zeros(lines.size, dtype=bool)
+        k = cand[inner]
+        step = (values[k + 1] - values[k - 1]) * sign
+        bridge[inner] = (step >= 1) & (step <= 3)
+
+        fixed[lines] |= in_range & (at_edge | bridge)
+    return fixed
+
+
+def batch_counts(values, token_line, total_lines, bad_lines, tolerate_one=False):
+    """
+    Classify every report at once. Returns per-line (valid, single) masks,
+    where single is only populated when tolerate_one is True.
+    """
+    line_len = np.bincount(token_line, minlength=total_lines)
+    line_start = np.cumsum(line_len) - line_len
+
+    valid = np.zeros(total_lines, dtype=bool)
+    single = np.zeros(total_lines, dtype=bool)
+    for sign in (1, -1):
+        bad = _bad_steps(values, token_line, sign)
+        first, last = _first_last_per_line(bad, token_line, total_lines)
+        valid |= first < 0
+        if tolerate_one:
+            single |= _one_removal_fixes(values, line_start, line_len, first, last, sign)
+
+    valid &= ~bad_lines
+    single &= ~bad_lines & ~valid
+    if not tolerate_one:
+        # Part 1 treats reports with fewer than two levels as failures
+        valid &= line_len >= 2
+    return valid, single
+
+
+def _block_counts(filename, tolerate_one):
+    """
+    Sum (total_lines, valid, single) over the file's blocks, so memory
+    follows BLOCK_BYTES rather than the file size.
+    """
+    total_lines = valid_count = single_count = 0
+    for raw in iter_blocks(filename):
+        values, token_line, lines, bad_lines = parse_reports(raw)
+        valid, single = batch_counts(values, token_line, lines, bad_lines, tolerate_one)
+        total_lines += lines
+        valid_count += int(valid.sum())
+        single_count += int(single.sum())
+    return total_lines, valid_count, single_count
+
+
+def process_file_batch(filename):
+    """
+    Batch equivalent of main.process_file.
+    """
+    try:
+        total_lines, pass_count, _ = _block_counts(filename, tolerate_one=False)
+    except FileNotFoundError:
+        print(f"Error: File '{filename}' not found.")
+        return None
+
+    return {
+        'total_lines': total_lines,
+        'pass_count': pass_count,
+        'fail_count': total_lines - pass_count
+    }
+
+
+def process_file_batch_tolerant(filename):
+    """
+    Batch equivalent of main2.process_file (without the per-line printout).
+    """
+    try:
+        total_lines, perfect_passes, single_violation = _block_counts(filename, tolerate_one=True)
+    except FileNotFoundError:
+        print(f"Error: File '{filename}' not found.")
+        return None
+
+    return {
+        'total_lines': total_lines,
+        'perfect_passes': perfect_passes,
+        'single_violation': single_violation,
+        'multiple_violations': total_lines - perfect_passes - single_violation
+    }
+
+
+if __name__ == "__main__":
+    import main
+    import main2
+
+    filename = sys.argv[1] if len(sys.argv) > 1 else "sequences.txt"
+
+    for label, batch_fn, line_fn in (
+        ("Part 1", process_file_batch, main.process_file),
+        ("Part 2", process_file_batch_tolerant, main2.process_file),
+    ):
+        start = time.perf_counter()
+        batch = batch_fn(filename)
+        batch_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            per_line = line_fn(filename)
+        line_time = time.perf_counter() - start
+
+        print(f"{label}: {batch}")
+        print(f"  batch {batch_time:.3f}s vs per-line {line_time:.3f}s, match: {batch == per_line}")
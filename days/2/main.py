@@ -28,35 +28,41 @@ def is_valid_sequence(numbers):
     
     return True
 
-def process_file(filename):
+def count_sequences(lines):
     """
-    Process a file line by line and count valid/invalid sequences.
+    Count valid/invalid sequences over any iterable of lines.
     """
     total_lines = 0
     pass_count = 0
     fail_count = 0
     
+    for line in lines:
+        total_lines += 1
+        
+        # Convert line to list of integers
+        try:
+            numbers = [int(x) for x in line.strip().split()]
+            if is_valid_sequence(numbers):
+                pass_count += 1
+            else:
+                fail_count += 1
+        except ValueError:
+            # If conversion fails, count as failed line
+            fail_count += 1
+    
+    return {
+        'total_lines': total_lines,
+        'pass_count': pass_count,
+        'fail_count': fail_count
+    }
+
+def process_file(filename):
+    """
+    Process a file line by line and count valid/invalid sequences.
+    """
     try:
         with open(filename, 'r') as file:
-            for line in file:
-                total_lines += 1
-                
-                # Convert line to list of integers
-                try:
-                    numbers = [int(x) for x in line.strip().split()]
-                    if is_valid_sequence(numbers):
-                        pass_count += 1
-                    else:
-                        fail_count += 1
-                except ValueError:
-                    # If conversion fails, count as failed line
-                    fail_count += 1
-                    
-        return {
-            'total_lines': total_lines,
-            'pass_count': pass_count,
-            'fail_count': fail_count
-        }
+            return count_sequences(file)
     
     except FileNotFoundError:
         print(f"Error: File '{filename}' not found.")
@@ -1,3 +1,5 @@
+import random
+
 def is_valid_sequence(numbers):
     """
     Check if a sequence is valid (all increasing or all decreasing by 1-3)
@@ -30,17 +32,14 @@ def is_valid_sequence(numbers):
     
     return True
 
-def analyze_sequence(numbers):
+def analyze_sequence_naive(numbers):
     """
-    Analyze a sequence and return details about violations.
-    Returns (violation_count, removed_index, resulting_sequence) if single violation,
-    or (violation_count, None, None) otherwise.
+    Reference version of analyze_sequence: rebuilds and re-validates the
+    sequence once per removed index, so it is O(n^2). Kept for cross-checking.
     """
-    # First check if sequence is already valid
     if is_valid_sequence(numbers):
         return 0, None, None
     
-    # Try removing each number and check if remaining sequence is valid
     for i in range(len(numbers)):
         subsequence = numbers[:i] + numbers[i+1:]
         if is_valid_sequence(subsequence):
@@ -48,51 +47,152 @@ def analyze_sequence(numbers):
     
     return 2, None, None
 
-def process_file(filename):
+def _first_and_last_bad_pair(numbers, sign):
     """
-    Process a file line by line and print details about sequences with single violations.
+    Return the index of the first and last adjacent pair (i, i+1) whose step,
+    taken in direction `sign` (+1 increasing, -1 decreasing), is not 1..3.
+    Returns (None, None) if every step is fine.
+    """
+    first_bad = last_bad = None
+    for i in range(len(numbers) - 1):
+        step = (numbers[i + 1] - numbers[i]) * sign
+        if step < 1 or step > 3:
+            if first_bad is None:
+                first_bad = i
+            last_bad = i
+    return first_bad, last_bad
+
+def _removable_index(numbers, sign, first_bad, last_bad):
+    """
+    Smallest index whose removal leaves a valid sequence in direction `sign`.
+
+    The prefix numbers[:i] is valid iff i <= first_bad + 1 and the suffix
+    numbers[i+1:] is valid iff i >= last_bad, so at most three indices need
+    their bridging step numbers[i-1] -> numbers[i+1] checked.
+    """
+    n = len(numbers)
+    for i in range(max(last_bad, 0), min(first_bad + 1, n - 1) + 1):
+        if i == 0 or i == n - 1:
+            return i
+        step = (numbers[i + 1] - numbers[i - 1]) * sign
+        if 1 <= step <= 3:
+            return i
+    return None
+
+def analyze_sequence(numbers, build_sequence=True):
+    """
+    Analyze a sequence and return details about violations.
+    Returns (violation_count, removed_index, resulting_sequence) if single violation,
+    or (violation_count, None, None) otherwise.
+
+    Runs in O(n) time: one scan per direction finds the first and last bad
+    step, which pins down the only indices worth removing. The resulting
+    sequence is only built when build_sequence is True.
+    """
+    if len(numbers) < 2:
+        return 0, None, None
+    
+    candidates = []
+    for sign in (1, -1):
+        first_bad, last_bad = _first_and_last_bad_pair(numbers, sign)
+        if first_bad is None:
+            return 0, None, None
+        idx = _removable_index(numbers, sign, first_bad, last_bad)
+        if idx is not None:
+            candidates.append(idx)
+    
+    if not candidates:
+        return 2, None, None
+    
+    removed_idx = min(candidates)
+    subsequence = numbers[:removed_idx] + numbers[removed_idx+1:] if build_sequence else None
+    return 1, removed_idx, subsequence
+
+def print_single_violation(line_num, numbers, removed_idx, valid_sequence):
+    print(f"Line {line_num}: {numbers}")
+    print(f"  Removing index {removed_idx} (value {numbers[removed_idx]}) makes valid: {valid_sequence}")
+    print()
+
+def classify_sequences(lines, on_single_violation=None):
+    """
+    Classify every line of an iterable by violation count. on_single_violation,
+    if given, is called as (line_num, numbers, removed_idx, valid_sequence)
+    for each line fixed by a single removal, in line order.
     """
     total_lines = 0
     perfect_passes = 0
     single_violation = 0
     multiple_violations = 0
     
+    for line_num, line in enumerate(lines, 1):
+        total_lines += 1
+        
+        try:
+            numbers = [int(x) for x in line.strip().split()]
+            violations, removed_idx, valid_sequence = analyze_sequence(
+                numbers, build_sequence=on_single_violation is not None)
+            
+            if violations == 0:
+                perfect_passes += 1
+            elif violations == 1:
+                single_violation += 1
+                if on_single_violation:
+                    on_single_violation(line_num, numbers, removed_idx, valid_sequence)
+            else:
+                multiple_violations += 1
+                
+        except ValueError:
+            multiple_violations += 1
+    
+    return {
+        'total_lines': total_lines,
+        'perfect_passes': perfect_passes,
+        'single_violation': single_violation,
+        'multiple_violations': multiple_violations
+    }
+
+def process_file(filename):
+    """
+    Process a file line by line and print details about sequences with single violations.
+    """
     try:
         with open(filename, 'r') as file:
             print("\nSequences with single violations:")
             print("-" * 50)
             
-            for line_num, line in enumerate(file, 1):
-                total_lines += 1
-                
-                try:
-                    numbers = [int(x) for x in line.strip().split()]
-                    violations, removed_idx, valid_sequence = analyze_sequence(numbers)
-                    
-                    if violations == 0:
-                        perfect_passes += 1
-                    elif violations == 1:
-                        single_violation += 1
-                        print(f"Line {line_num}: {numbers}")
-                        print(f"  Removing index {removed_idx} (value {numbers[removed_idx]}) makes valid: {valid_sequence}")
-                        print()
-                    else:
-                        multiple_violations += 1
-                        
-                except ValueError:
-                    multiple_violations += 1
-                    
-        return {
-            'total_lines': total_lines,
-            'perfect_passes': perfect_passes,
-            'single_violation': single_violation,
-            'multiple_violations': multiple_violations
-        }
+            return classify_sequences(file, print_single_violation)
     
     except FileNotFoundError:
         print(f"Error: File '{filename}' not found.")
         return None
 
+def cross_check(filename=None, trials=20000, seed=0):
+    """
+    Compare analyze_sequence against analyze_sequence_naive on random
+    sequences (and on every line of filename, if given). Returns the number
+    of mismatches found.
+    """
+    rng = random.Random(seed)
+    samples = []
+    for _ in range(trials):
+        length = rng.randint(0, 10)
+        start = rng.randint(1, 20)
+        seq = [start]
+        for _ in range(length - 1):
+            seq.append(seq[-1] + rng.choice([-4, -3, -2, -1, 0, 1, 2, 3, 4]))
+        samples.append(seq[:length])
+    
+    if filename:
+        with open(filename, 'r') as file:
+            samples.extend([int(x) for x in line.split()] for line in file)
+    
+    mismatches = 0
+    for seq in samples:
+        if analyze_sequence(seq) != analyze_sequence_naive(seq):
+            mismatches += 1
+            print(f"Mismatch on {seq}: {analyze_sequence(seq)} != {analyze_sequence_naive(seq)}")
+    return mismatches
+
 # Test cases
 def run_tests():
     test_cases = [
@@ -116,6 +216,9 @@ def run_tests():
         if violations == 1:
             print(f"  Removing index {removed_idx} (value {sequence[removed_idx]}) makes valid: {valid_sequence}")
         print()
+    
+    mismatches = cross_check("sequences.txt")
+    print(f"Linear vs naive analyze_sequence mismatches: {mismatches}")
 
 if __name__ == "__main__":
     # Run test cases
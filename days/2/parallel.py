@@ -0,0 +1,153 @@
+import io
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from main import count_sequences
+from main2 import classify_sequences, print_single_violation
+
+CHUNKS_PER_WORKER = 4  # a few chunks per worker evens out uneven line lengths
+
+
+def chunk_ranges(filename, chunks):
+    """
+    Split a file into at most `chunks` byte ranges [start, end) whose
+    boundaries sit just after a newline, so no line is cut in two.
+    """
+    size = os.path.getsize(filename)
+    if size == 0:
+        return []
+
+    bounds = [0]
+    with open(filename, 'rb') as file:
+        for i in range(1, chunks):
+            target = max(size * i // chunks, bounds[-1])
+            if target >= size:
+                break
+            file.seek(target)
+            file.readline()  # skip to the end of the line we landed in
+            boundary = file.tell()
+            if boundary >= size:
+                break
+            if boundary > bounds[-1]:
+                bounds.append(boundary)
+    bounds.append(size)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def read_chunk(filename, start, end):
+    """
+    Yield the lines of a byte range one at a time, split and newline-
+    translated the same way iterating over open(filename, 'r') does, so a
+    worker holds one line at a time however big its range is.
+    """
+    with open(filename, 'rb') as file:
+        file.seek(start)
+        position = start
+        while position < end:
+            line = file.readline()
+            if not line:
+                break
+            position += len(line)
+            text = line.decode()
+            if '\r' in text:
+                # A lone \r ends a line too in text mode
+                yield from io.StringIO(text, newline=None)
+            else:
+                yield text
+
+
+def _count_chunk(args):
+    filename, start, end = args
+    return count_sequences(read_chunk(filename, start, end))
+
+
+def _classify_chunk(args):
+    filename, start, end = args
+    singles = []
+    counts = classify_sequences(read_chunk(filename, start, end),
+                                lambda *detail: singles.append(detail))
+    return counts, singles
+
+
+def merge_counts(parts):
+    """
+    Sum a sequence of counter dicts key by key.
+    """
+    merged = {}
+    for part in parts:
+        for key, value in part.items():
+            merged[key] = merged.get(key, 0) + value
+    return merged
+
+
+def _map_chunks(worker, filename, workers):
+    workers = workers or os.cpu_count() or 1
+    tasks = [(filename, start, end)
+             for start, end in chunk_ranges(filename, workers * CHUNKS_PER_WORKER)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # map() yields results in submission order, i.e. file order
+        yield from pool.map(worker, tasks)
+
+
+def process_file_parallel(filename, workers=None):
+    """
+    Parallel equivalent of main.process_file.
+    """
+    try:
+        return merge_counts(_map_chunks(_count_chunk, filename, workers)) or count_sequences([])
+    except FileNotFoundError:
+        print(f"Error: File '{filename}' not found.")
+        return None
+
+
+def process_file_parallel_tolerant(filename, workers=None, show_singles=True):
+    """
+    Parallel equivalent of main2.process_file. Single-violation details are
+    printed in line order once each chunk's result arrives.
+    """
+    try:
+        if show_singles:
+            print("\nSequences with single violations:")
+            print("-" * 50)
+
+        parts = []
+        line_offset = 0
+        for counts, singles in _map_chunks(_classify_chunk, filename, workers):
+            if show_singles:
+                for line_num, numbers, removed_idx, valid_sequence in singles:
+                    print_single_violation(line_offset + line_num, numbers, removed_idx, valid_sequence)
+            line_offset += counts['total_lines']
+            parts.append(counts)
+        return merge_counts(parts) or classify_sequences([])
+    except FileNotFoundError:
+        print(f"Error: File '{filename}' not found.")
+        return None
+
+
+if __name__ == "__main__":
+    import contextlib
+    from main import process_file
+    from main2 import process_file as process_file_tolerant
+
+    filename = sys.argv[1] if len(sys.argv) > 1 else "sequences.txt"
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+
+    for label, parallel_fn, line_fn in (
+        ("Part 1", process_file_parallel, process_file),
+        ("Part 2", process_file_parallel_tolerant, process_file_tolerant),
+    ):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()) as parallel_out:
+            parallel = parallel_fn(filename, workers)
+        parallel_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()) as line_out:
+            single = line_fn(filename)
+        line_time = time.perf_counter() - start
+
+        print(f"{label}: {parallel}")
+        print(f"  parallel {parallel_time:.3f}s vs single-process {line_time:.3f}s, "
+              f"match: {parallel == single and parallel_out.getvalue() == line_out.getvalue()}")
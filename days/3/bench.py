@@ -0,0 +1,68 @@
+import os
+import random
+import sys
+import tempfile
+
+from dfa import np, process_file
+
+BLOCK_SIZE = 1 << 20
+
+
+def make_block(rng, size=BLOCK_SIZE, toggles=True):
+    """
+    Build one block of synthetic corrupted memory: real instructions mixed
+    with near-misses ("mul(1234,5)", "mul[3,7]", "don't") and filler. With
+    toggles off the block has no do()/don't(), so whole chunks run on the
+    state carried in from before.
+    """
+    pieces = []
+    length = 0
+    while length < size:
+        roll = rng.random()
+        if roll < 0.25:
+            piece = f"mul({rng.randint(0, 999)},{rng.randint(0, 999)})"
+        elif roll < 0.30 and toggles:
+            piece = rng.choice(["do()", "don't()"])
+        elif roll < 0.55:
+            piece = rng.choice(["mul(", "mul(1234,5)", "mul[3,7]", "mul(2,4]", "mu", "don't", "do(", "m", "d"])
+        else:
+            piece = "".join(rng.choice("!@#$%^&*()[]{}<>?,'+-_ select who what where how from ")
+                            for _ in range(rng.randint(1, 12)))
+        pieces.append(piece)
+        length += len(piece)
+    return "".join(pieces).encode()[:size]
+
+
+def write_synthetic(path, size_mb, seed=0):
+    """
+    Write size_mb megabytes of synthetic memory, cycling through a handful
+    of distinct blocks so generation does not dominate the benchmark. Every
+    other block has no toggles.
+    """
+    rng = random.Random(seed)
+    blocks = [make_block(rng, toggles=i % 2 == 0) for i in range(min(size_mb, 8))]
+    with open(path, 'wb') as file:
+        for i in range(size_mb):
+            file.write(blocks[i % len(blocks)])
+
+
+if __name__ == "__main__":
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 1024
+    engines = sys.argv[2].split(",") if len(sys.argv) > 2 else \
+        ["regex", "dfa"] + (["numpy"] if np is not None else [])
+
+    fd, path = tempfile.mkstemp(suffix=".txt")
+    os.close(fd)
+    try:
+        print(f"Generating {size_mb} MB of synthetic memory...")
+        write_synthetic(path, size_mb)
+
+        baseline = None
+        for engine in engines:
+            results = process_file(path, engine=engine)
+            sums = (results['sum_all'], results['sum_enabled'])
+            baseline = baseline or sums
+            print(f"{engine:>6}: {results['elapsed']:8.2f}s  {results['mb_per_s']:8.1f} MB/s  "
+                  f"muls={results['mul_count']}  match={sums == baseline}")
+    finally:
+        os.remove(path)
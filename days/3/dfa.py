@@ -0,0 +1,276 @@
+import random
+import time
+
+from main import CHUNK_SIZE, MAX_TOKEN_LEN, iter_chunks, scan_chunks, process_file as process_file_scanner
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# DFA states. Failing in any state restarts from START on the same byte,
+# which is enough because 'm' and 'd' only ever appear at token starts.
+(START, M, MU, MUL, MUL_OPEN, A1, A2, A3, COMMA, B1, B2, B3,
+ D, DO, DO_OPEN, DON, DON_Q, DON_QT, DON_QT_OPEN) = range(19)
+# Accepting transitions, handled by the scanner and followed by START
+MUL_DONE, DO_DONE, DONT_DONE = 19, 20, 21
+
+
+def _build_table():
+    """
+    Transition table indexed as table[state][byte] -> next state.
+    """
+    restart = [START] * 256
+    restart[ord("m")] = M
+    restart[ord("d")] = D
+    table = [list(restart) for _ in range(MUL_DONE)]
+
+    def on(state, chars, target):
+        for c in chars:
+            table[state][ord(c)] = target
+
+    digits = "0123456789"
+    on(M, "u", MU)
+    on(MU, "l", MUL)
+    on(MUL, "(", MUL_OPEN)
+    on(MUL_OPEN, digits, A1)
+    on(A1, digits, A2)
+    on(A2, digits, A3)
+    for state in (A1, A2, A3):
+        on(state, ",", COMMA)
+    on(COMMA, digits, B1)
+    on(B1, digits, B2)
+    on(B2, digits, B3)
+    for state in (B1, B2, B3):
+        on(state, ")", MUL_DONE)
+    on(D, "o", DO)
+    on(DO, "(", DO_OPEN)
+    on(DO_OPEN, ")", DO_DONE)
+    on(DO, "n", DON)
+    on(DON, "'", DON_Q)
+    on(DON_Q, "t", DON_QT)
+    on(DON_QT, "(", DON_QT_OPEN)
+    on(DON_QT_OPEN, ")", DONT_DONE)
+    return table
+
+
+TABLE = _build_table()
+
+
+def scan_dfa(chunks):
+    """
+    Scan a stream of byte chunks with a hand-rolled DFA and yield
+    (a, b, enabled) for every mul. Each byte is looked at once and operands
+    are accumulated arithmetically, so no strings or match objects are made.
+    The state lives across chunks, so tokens split by a boundary need no
+    carry-over buffer.
+    """
+    table = TABLE
+    state = START
+    enabled = True
+    a = b = 0
+
+    for chunk in chunks:
+        n = len(chunk)
+        i = 0
+        next_m = next_d = -1
+        while i < n:
+            if state == START:
+                # Nothing can start before the next 'm' or 'd', so let
+                # bytes.find skip there in C
+                if next_m < i:
+                    next_m = chunk.find(b"m", i)
+                    if next_m < 0:
+                        next_m = n
+                if next_d < i:
+                    next_d = chunk.find(b"d", i)
+                    if next_d < 0:
+                        next_d = n
+                i = next_m if next_m < next_d else next_d
+                if i >= n:
+                    break
+
+            c = chunk[i]
+            state = table[state][c]
+            if state >= A1 and state <= B3:
+                if state == A1:
+                    a = c - 48
+                elif state <= A3:
+                    a = a * 10 + c - 48
+                elif state == B1:
+                    b = c - 48
+                elif state != COMMA:
+                    b = b * 10 + c - 48
+            elif state >= MUL_DONE:
+                if state == MUL_DONE:
+                    yield a, b, enabled
+                else:
+                    enabled = state == DO_DONE
+                state = START
+            i += 1
+
+
+def _match_at(window, literal):
+    """
+    Rows of a 2D byte window that start with the given literal.
+    """
+    return np.all(window[:, :len(literal)] == np.frombuffer(literal, np.uint8), axis=1)
+
+
+def _parse_operand(window):
+    """
+    Parse 1-3 leading digits of every row of a byte window. Returns the
+    digit count (0 when the row is not a valid operand) and the values.
+    """
+    digit = window.astype(np.int64) - ord("0")
+    is_digit = (digit >= 0) & (digit <= 9)
+    # First non-digit column; rows of 4+ digits come out as 0 or > 3
+    length = np.argmin(is_digit, axis=1)
+    length[(length == 0) | (length > 3)] = 0
+
+    place = length[:, None] - 1 - np.arange(3)
+    weights = np.where(place >= 0, 10 ** np.maximum(place, 0), 0)
+    values = (np.where(is_digit[:, :3], digit[:, :3], 0) * weights).sum(axis=1)
+    return length, values
+
+
+def scan_batches(chunks):
+    """
+    NumPy counterpart of scan_dfa. Candidate 'm' and 'd' offsets of each
+    chunk are found with vector compares, every candidate is checked at once
+    through gathered byte windows, and one (a, b, enabled) array triple is
+    yielded per chunk.
+    """
+    if np is None:
+        raise ImportError("scan_batches requires numpy")
+
+    enabled = True
+    carry = b""
+    chunks = iter(chunks)
+    chunk = next(chunks, None)
+    window_cols = np.arange(MAX_TOKEN_LEN)
+
+    while chunk is not None:
+        buffer = carry + chunk
+        chunk = next(chunks, None)
+        # Tokens starting in the last MAX_TOKEN_LEN - 1 bytes may be cut off,
+        # leave them for the next chunk
+        cutoff = len(buffer) if chunk is None else max(len(buffer) - MAX_TOKEN_LEN + 1, 0)
+        carry = buffer[cutoff:]
+
+        data = np.frombuffer(buffer, dtype=np.uint8)
+        padded = np.concatenate((data, np.zeros(MAX_TOKEN_LEN, dtype=np.uint8)))
+        head = data[:cutoff]
+
+        starts_d = np.flatnonzero(head == ord("d"))
+        window = padded[starts_d[:, None] + window_cols]
+        is_do = _match_at(window, b"do()")
+        is_dont = _match_at(window, b"don't()")
+        toggle_pos = starts_d[is_do | is_dont]
+        toggle_val = is_do[is_do | is_dont]
+
+        starts_m = np.flatnonzero(head == ord("m"))
+        window = padded[starts_m[:, None] + window_cols]
+        is_mul = _match_at(window, b"mul(")
+        starts_m, window = starts_m[is_mul], window[is_mul]
+
+        rows = np.arange(len(window))
+        len_a, a = _parse_operand(window[:, 4:])
+        ok = (len_a > 0) & (window[rows, 4 + len_a] == ord(","))
+        second = window[rows[:, None], 5 + len_a[:, None] + np.arange(4)]
+        len_b, b = _parse_operand(second)
+        ok &= (len_b > 0) & (second[rows, len_b] == ord(")"))
+
+        mul_pos = starts_m[ok]
+        last_toggle = np.searchsorted(toggle_pos, mul_pos) - 1
+        # Slot 0 is the state carried in from earlier chunks, so chunks
+        # without any toggle index it too
+        mul_enabled = np.concatenate(([enabled], toggle_val))[last_toggle + 1]
+        if toggle_val.size:
+            enabled = bool(toggle_val[-1])
+
+        yield a[ok], b[ok], mul_enabled
+
+
+def process_file(filename, chunk_size=CHUNK_SIZE, engine="dfa"):
+    """
+    Same result dict as main.process_file, using the DFA ("dfa"), the NumPy
+    batched path ("numpy") or the original regex scanner ("regex").
+    """
+    if engine == "regex":
+        return process_file_scanner(filename, chunk_size)
+    if engine == "dfa":
+        return process_file_scanner(filename, chunk_size, scanner=scan_dfa)
+
+    total_bytes = 0
+    mul_count = 0
+    sum_all = 0
+    sum_enabled = 0
+
+    def counted(chunks):
+        nonlocal total_bytes
+        for chunk in chunks:
+            total_bytes += len(chunk)
+            yield chunk
+
+    try:
+        start = time.perf_counter()
+        for a, b, enabled in scan_batches(counted(iter_chunks(filename, chunk_size))):
+            products = a * b
+            mul_count += len(products)
+            sum_all += int(products.sum())
+            sum_enabled += int(products[enabled].sum())
+        elapsed = time.perf_counter() - start
+    except FileNotFoundError:
+        print(f"Error: File '{filename}' not found.")
+        return None
+
+    return {
+        'total_bytes': total_bytes,
+        'mul_count': mul_count,
+        'sum_all': sum_all,
+        'sum_enabled': sum_enabled,
+        'elapsed': elapsed,
+        'mb_per_s': total_bytes / 1e6 / elapsed if elapsed else float('inf')
+    }
+
+
+def cross_check(trials=2000, seed=0):
+    """
+    Compare scan_dfa and scan_batches against the regex scanner on random
+    near-miss memory split at random chunk sizes. Returns the mismatch count.
+    """
+    rng = random.Random(seed)
+    pieces = [b"mul(", b"mul", b"mu", b"m", b"(", b")", b",", b"1", b"23", b"456", b"7890",
+              b"do()", b"don't()", b"do", b"don't", b"d", b"n't(", b"x", b" "]
+    # Every few trials, leave toggles out so whole chunks run on carried state
+    plain = [piece for piece in pieces if not piece.startswith(b"d")]
+    mismatches = 0
+    for trial in range(trials):
+        choices = plain if trial % 4 == 0 else pieces
+        memory = b"".join(rng.choice(choices) for _ in range(rng.randint(0, 60)))
+        chunk_size = rng.randint(1, 20)
+        chunks = [memory[i:i + chunk_size] for i in range(0, len(memory), chunk_size)]
+
+        expected = list(scan_chunks(chunks))
+        results = {"dfa": list(scan_dfa(chunks))}
+        if np is not None:
+            results["numpy"] = [(int(a), int(b), bool(e))
+                                for batch in scan_batches(chunks) for a, b, e in zip(*batch)]
+        for engine, got in results.items():
+            if got != expected:
+                mismatches += 1
+                print(f"Mismatch ({engine}, chunk_size={chunk_size}) on {memory!r}")
+    return mismatches
+
+
+if __name__ == "__main__":
+    print(f"DFA/NumPy vs regex mismatches: {cross_check()}")
+
+    filename = "input.txt"
+    engines = ["regex", "dfa"] + (["numpy"] if np is not None else [])
+    for engine in engines:
+        results = process_file(filename, engine=engine)
+        if results:
+            print(f"{engine:>6}: all={results['sum_all']} enabled={results['sum_enabled']} "
+                  f"({results['mb_per_s']:.1f} MB/s)")
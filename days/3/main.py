@@ -1,17 +1,141 @@
 import re
+import time
 
-# Example with specific patterns
-text = "There are 12 months and 30 days"
-numbers = [int(num) for num in re.findall(r'\d+', text)]
-if len(numbers) >= 2:
-    result = numbers[0] * numbers[1]
-    print(f"Found numbers {numbers[0]} and {numbers[1]}, product is {result}")
+# mul(X,Y) with 1-3 digit operands, plus the do()/don't() toggles
+INSTRUCTION = re.compile(rb"mul\((\d{1,3}),(\d{1,3})\)|do\(\)|don't\(\)")
+MAX_TOKEN_LEN = len(b"mul(123,456)")
+CHUNK_SIZE = 1 << 20
 
 
-    if __name__ == "__main__":
+def iter_chunks(filename, chunk_size=CHUNK_SIZE):
+    """
+    Yield a file as fixed-size byte chunks so memory stays flat no matter
+    how large the corrupted-memory dump is.
+    """
+    with open(filename, 'rb') as file:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def scan_chunks(chunks):
+    """
+    Scan a stream of byte chunks and yield (a, b, enabled) for every mul.
+
+    Tokens can span chunk boundaries: a match is only accepted once the
+    buffer holds MAX_TOKEN_LEN bytes from its start, anything later is
+    carried over and rescanned together with the next chunk.
+    """
+    enabled = True
+    carry = b""
+    chunks = iter(chunks)
+    chunk = next(chunks, None)
+
+    while chunk is not None:
+        buffer = carry + chunk
+        chunk = next(chunks, None)
+        final = chunk is None
+        cutoff = len(buffer) if final else len(buffer) - MAX_TOKEN_LEN + 1
+        resume = max(cutoff, 0)
+
+        for match in INSTRUCTION.finditer(buffer):
+            if match.start() >= cutoff:
+                break
+            resume = max(resume, match.end())
+            token = match.group()
+            if token == b"do()":
+                enabled = True
+            elif token == b"don't()":
+                enabled = False
+            else:
+                yield int(match.group(1)), int(match.group(2)), enabled
+
+        carry = buffer[resume:]
+
+
+def process_file(filename, chunk_size=CHUNK_SIZE, scanner=scan_chunks):
+    """
+    Scan a file for mul instructions and return the part 1 sum (every mul),
+    the part 2 sum (only muls enabled by do()/don't()) and the throughput.
+    scanner is any function turning byte chunks into (a, b, enabled) triples.
+    """
+    total_bytes = 0
+
+    def counted(chunks):
+        nonlocal total_bytes
+        for chunk in chunks:
+            total_bytes += len(chunk)
+            yield chunk
+
+    mul_count = 0
+    sum_all = 0
+    sum_enabled = 0
+
+    try:
+        start = time.perf_counter()
+        for a, b, enabled in scanner(counted(iter_chunks(filename, chunk_size))):
+            mul_count += 1
+            product = a * b
+            sum_all += product
+            if enabled:
+                sum_enabled += product
+        elapsed = time.perf_counter() - start
+    except FileNotFoundError:
+        print(f"Error: File '{filename}' not found.")
+        return None
+
+    return {
+        'total_bytes': total_bytes,
+        'mul_count': mul_count,
+        'sum_all': sum_all,
+        'sum_enabled': sum_enabled,
+        'elapsed': elapsed,
+        'mb_per_s': total_bytes / 1e6 / elapsed if elapsed else float('inf')
+    }
+
+
+# Test cases
+def run_tests():
+    test_cases = [
+        # (memory, expected sum of all muls, expected sum of enabled muls)
+        (b"xmul(2,4)%&mul[3,7]!@^do_not_mul(5,5)+mul(32,64]then(mul(11,8)mul(8,5))", 161, 161),
+        (b"xmul(2,4)&mul[3,7]!^don't()_mul(5,5)+mul(32,64](mul(11,8)undo()?mul(8,5))", 161, 48),
+        (b"mul(1234,5)mul(12,34 )mul ( 2,3)mul(4,5)", 20, 20),
+        (b"mumul(2,3)don'tdo()don't()mul(9,9)", 87, 6),
+    ]
+
+    print("\nAnalyzing test cases:")
+    print("-" * 50)
+    for memory, expected_all, expected_enabled in test_cases:
+        # Every chunk size must agree, including ones that cut through tokens
+        for chunk_size in (1, 2, 3, 5, 7, 11, 12, 13, len(memory)):
+            chunks = [memory[i:i + chunk_size] for i in range(0, len(memory), chunk_size)]
+            muls = list(scan_chunks(chunks))
+            got_all = sum(a * b for a, b, _ in muls)
+            got_enabled = sum(a * b for a, b, enabled in muls if enabled)
+            if (got_all, got_enabled) != (expected_all, expected_enabled):
+                print(f"FAIL chunk_size={chunk_size}: {memory!r}")
+                print(f"  got ({got_all}, {got_enabled}), expected ({expected_all}, {expected_enabled})")
+                break
+        else:
+            print(f"PASS: {memory!r}")
+
+
+if __name__ == "__main__":
     # Run test cases
     run_tests()
-    
+
     # Process file if filename provided
-    filename = "sequences.txt"  # Replace with your input file name
-    results = process_file(filename)
\ No newline at end of file
+    filename = "input.txt"  # Replace with your input file name
+    results = process_file(filename)
+
+    if results:
+        print("\nSummary:")
+        print("-" * 50)
+        print(f"Bytes scanned: {results['total_bytes']}")
+        print(f"mul instructions found: {results['mul_count']}")
+        print(f"Sum of all products: {results['sum_all']}")
+        print(f"Sum of enabled products: {results['sum_enabled']}")
+        print(f"Throughput: {results['mb_per_s']:.1f} MB/s")
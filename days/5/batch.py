@@ -0,0 +1,190 @@
+import time
+from itertools import chain
+
+import numpy as np
+
+from main import pages_file, rules_file
+from reader import read_rules
+
+DENSE_PAGES = 100  # pages are two-digit numbers, so 0..99 covers the input
+PAD = DENSE_PAGES  # padding gets its own all-False row/column in the matrix
+BLOCK_ROWS = 1 << 16  # rows checked per vectorized block, bounds temporaries
+
+
+# Step 1: Rules as a dense boolean matrix
+def build_matrix(rules):
+    """
+    matrix[left, right] is True when left must come before right. Rules that
+    mention a page outside 0..99 are left out; rows containing such pages
+    are checked by check_positions instead.
+    """
+    matrix = np.zeros((DENSE_PAGES + 1, DENSE_PAGES + 1), dtype=bool)
+    for left, right in rules:
+        if 0 <= left < DENSE_PAGES and 0 <= right < DENSE_PAGES:
+            matrix[left, right] = True
+    return matrix
+
+
+# Step 2: Rows as a padded int array
+def pad_rows(flat, lengths):
+    """
+    Scatter a flat array of pages into an (n_rows, max_len) array, padding
+    short rows with PAD.
+    """
+    n_rows = lengths.size
+    width = int(lengths.max()) if n_rows else 0
+    padded = np.full((n_rows, width), PAD, dtype=np.int64)
+    offsets = np.cumsum(lengths) - lengths
+    row_of = np.repeat(np.arange(n_rows), lengths)
+    padded[row_of, np.arange(flat.size) - offsets[row_of]] = flat
+    return padded
+
+
+def encode_rows(pages):
+    lengths = np.fromiter(map(len, pages), dtype=np.int64, count=len(pages))
+    flat = np.fromiter(chain.from_iterable(pages), dtype=np.int64, count=int(lengths.sum()))
+    return pad_rows(flat, lengths), lengths
+
+
+def load_rows(file_path):
+    """
+    Parse an update file straight into a padded array without building a
+    list per row.
+    """
+    with open(file_path, "r") as file:
+        # Rule lines only show up in a combined input file
+        lines = [line for line in file.read().split() if "|" not in line]
+    lengths = np.fromiter((line.count(",") + 1 for line in lines), dtype=np.int64, count=len(lines))
+    flat = np.array(",".join(lines).split(","), dtype=np.int64) if lines else np.zeros(0, np.int64)
+    return pad_rows(flat, lengths), lengths
+
+
+# Step 3: Check every row at once
+def pack_matrix(matrix):
+    """
+    Pack each matrix row into two uint64 words (pages 0..63 and 64..127),
+    so packed[p] is the bitset of pages that must come after p.
+    """
+    wide = np.zeros((matrix.shape[0], 128), dtype=bool)
+    wide[:, :matrix.shape[1]] = matrix
+    return np.packbits(wide, axis=1, bitorder="little").view("<u8")
+
+
+def bit_tables():
+    """
+    One-hot bitset (two uint64 words) for every page code; PAD gets no bits.
+    """
+    pages = np.arange(DENSE_PAGES + 1, dtype=np.uint64)
+    one = np.uint64(1)
+    low = np.where(pages < 64, one << (pages & np.uint64(63)), np.uint64(0))
+    high = np.where((pages >= 64) & (pages < DENSE_PAGES), one << (pages & np.uint64(63)), np.uint64(0))
+    return low, high
+
+
+def page_codes(padded):
+    """
+    Pages as uint8 table indices, column by column: codes[j] is column j of
+    the block. Padding and pages outside 0..99 become PAD.
+    """
+    dense = (padded >= 0) & (padded < DENSE_PAGES)
+    return np.where(dense, padded, PAD).astype(np.uint8).T.copy()
+
+
+def check_padded(padded, lengths, matrix):
+    """
+    A row fails if any later page j must come before an earlier page i,
+    i.e. matrix[row[j], row[i]] for some j > i. With the matrix rows packed
+    into bitsets, the block is walked one column at a time: page j fails if
+    its "must come after" set meets the running set of pages seen so far.
+    Every per-cell value comes from a small lookup table, so each column
+    costs a handful of vector ops over the block's rows.
+
+    Returns (valid, fallback), where fallback marks rows the matrix can't
+    judge: pages outside 0..99, or repeated pages (only a page's first
+    occurrence counts).
+    """
+    packed = pack_matrix(matrix)
+    after_low, after_high = packed[:, 0].copy(), packed[:, 1].copy()
+    bit_low, bit_high = bit_tables()
+    width = padded.shape[1]
+    valid = np.empty(len(padded), dtype=bool)
+    fallback = np.empty(len(padded), dtype=bool)
+
+    for start in range(0, len(padded), BLOCK_ROWS):
+        block = padded[start:start + BLOCK_ROWS]
+        codes = page_codes(block)
+        rows = len(block)
+        seen_low = np.zeros(rows, dtype=np.uint64)
+        seen_high = np.zeros(rows, dtype=np.uint64)
+        bad = np.zeros(rows, dtype=bool)
+        repeated = np.zeros(rows, dtype=bool)
+        for column in codes:
+            low, high = bit_low.take(column), bit_high.take(column)
+            bad |= ((seen_low & after_low.take(column)) | (seen_high & after_high.take(column))) != 0
+            repeated |= ((seen_low & low) | (seen_high & high)) != 0
+            seen_low |= low
+            seen_high |= high
+        valid[start:start + BLOCK_ROWS] = ~bad
+
+        # Padding cells are PAD too, so anything beyond them is a real page
+        # outside 0..99
+        not_dense = np.count_nonzero((block < 0) | (block >= DENSE_PAGES), axis=1)
+        out_of_range = not_dense > width - lengths[start:start + BLOCK_ROWS]
+        fallback[start:start + BLOCK_ROWS] = out_of_range | repeated
+    return valid, fallback
+
+
+# Step 4: Rows the matrix can't judge
+def group_rules(rules):
+    """Map each page to the pages that must come after it"""
+    after = {}
+    for left, right in rules:
+        after.setdefault(left, []).append(right)
+    return after
+
+
+def check_positions(row, after):
+    """
+    The baseline row.index() check, so any int is a valid page: a row fails
+    if some page's first occurrence comes after the first occurrence of a
+    page it must precede. Only the rules of pages in the row are looked at.
+    """
+    position = {}
+    for i, page in enumerate(row):
+        position.setdefault(page, i)
+    for page, i in position.items():
+        for right in after.get(page, ()):
+            if position.get(right, i) < i:
+                return False
+    return True
+
+
+def check_rules_batch(pages, rules):
+    """
+    Same results as main.check_rules (middle page if the row passes, else 0).
+    pages may be a list of rows or an already encoded (padded, lengths) pair.
+    """
+    padded, lengths = encode_rows(pages) if isinstance(pages, list) else pages
+    valid, fallback = check_padded(padded, lengths, build_matrix(rules))
+
+    fallback = np.flatnonzero(fallback)
+    if fallback.size:
+        after = group_rules(rules)
+        for r in fallback:
+            valid[r] = check_positions(padded[r, :lengths[r]].tolist(), after)
+
+    middle = padded[np.arange(len(padded)), lengths // 2]
+    return np.where(valid, middle, 0)
+
+
+# Main logic
+if __name__ == "__main__":
+    rules = read_rules(rules_file)
+
+    start = time.perf_counter()
+    encoded = load_rows(pages_file)
+    results = check_rules_batch(encoded, rules)
+    elapsed = time.perf_counter() - start
+
+    print(f"Total sum is {int(results.sum())}")
+    print(f"Checked {len(results)} rows in {elapsed * 1000:.2f} ms")
@@ -1,53 +1,89 @@
+import json
+import os
+
+from reader import iter_rules, read_pages
+
 # Define the file paths
 rules_file = "rules.txt"
 pages_file = "pages.txt"
+index_file = "rules_index.json"
+INDEX_FORMAT = 2  # bumped when the cached index layout changes
+UNRULED = (0, 0)  # index entry for a page no rule mentions
+
+
+# Step 1: Compile the rules into a precedence index
+def build_index(rules):
+    """
+    Fold an iterable of (left, right) rules into a map from each page to
+    (bit, after): bit is the page's own bit and after the bitmask of the
+    pages that must come after it. Bits are dense ids handed out in order of
+    first appearance, so any int is a valid page and the masks stay as wide
+    as the number of distinct pages. Pages no rule mentions are not in the
+    index; they can't break a rule.
+    """
+    bits = {}
+    after = {}
+    for left, right in rules:
+        for page in (left, right):
+            if page not in bits:
+                bits[page] = 1 << len(bits)
+                after[page] = 0
+        after[left] |= bits[right]
+    return {page: (bit, after[page]) for page, bit in bits.items()}
+
+
+def load_index(rules_path, cache_path=None):
+    """
+    Read and compile rules_path, reusing cache_path if it was built from the
+    same version of the rules file (same size and mtime).
+    """
+    stat = os.stat(rules_path)
+    source = {"path": os.path.abspath(rules_path), "size": stat.st_size, "mtime": stat.st_mtime,
+              "format": INDEX_FORMAT}
+
+    if cache_path and os.path.exists(cache_path):
+        with open(cache_path, "r") as file:
+            cached = json.load(file)
+        if cached.get("source") == source:
+            return {int(page): tuple(entry) for page, entry in cached["index"].items()}
+
+    index = build_index(iter_rules(rules_path))
+    if cache_path:
+        with open(cache_path, "w") as file:
+            json.dump({"source": source, "index": index}, file)
+    return index
 
 
-# Step 1: Read the rules
-def read_rules(file_path):
-    rules = []
-    with open(file_path, "r") as file:
-        for line in file:
-            left, right = map(int, line.strip().split("|"))
-            rules.append((left, right))
-    return rules
+# Step 2: Check rules for each row
+def check_row(row, index):
+    """
+    A row passes if no page shows up after a page it must precede. Only the
+    first occurrence of a page counts, like row.index() does.
+    """
+    seen = 0
+    for page in row:
+        bit, after = index.get(page, UNRULED)
+        if seen & bit:
+            continue
+        if seen & after:
+            return False
+        seen |= bit
+    return True
 
 
-# Step 2: Read the pages
-def read_pages(file_path):
-    pages = []
-    with open(file_path, "r") as file:
-        for line in file:
-            stripped_line = line.strip()
-            if stripped_line:  # Skip empty lines
-                pages.append(list(map(int, stripped_line.split(","))))
-    return pages
+def check_rules_indexed(pages, index):
+    return [row[len(row) // 2] if check_row(row, index) else 0 for row in pages]
 
 
-# Step 3: Check rules for each row
 def check_rules(pages, rules):
-    results = []
-    for row in pages:
-        satisfies_all = row[len(row) // 2]
-        for left, right in rules:
-            try:
-                left_index = row.index(left)
-                right_index = row.index(right)
-                if left_index > right_index:
-                    satisfies_all = 0
-                    break
-            except ValueError:
-                # If either left or right is not in the row, ignore this rule
-                continue
-        results.append(satisfies_all)
-    return results
+    return check_rules_indexed(pages, build_index(rules))
 
 
 # Main logic
 if __name__ == "__main__":
-    rules = read_rules(rules_file)
+    index = load_index(rules_file, index_file)
     pages = read_pages(pages_file)
-    results = check_rules(pages, rules)
+    results = check_rules_indexed(pages, index)
 
     for i, result in enumerate(results):
         # print(f"Row {i + 1}: {'Pass' if result else 'Fail'}")
@@ -1,64 +1,58 @@
+from main import UNRULED, build_index
+from reader import read_pages, read_rules
+
 # Define the file paths
 rules_file = "rules.txt"
 pages_file = "fails.csv"
 
 
-# Step 1: Read the rules
-def read_rules(file_path):
-    rules = []
-    with open(file_path, "r") as file:
-        for line in file:
-            left, right = map(int, line.strip().split("|"))
-            rules.append((left, right))
-    return rules
-
+# Step 1: Reorder each row with a topological sort of its own rules
+def reorder_row(row, before):
+    """
+    Return a copy of row sorted so every rule between its pages holds, using
+    Kahn's algorithm on the rules induced by the row's pages. `before` is a
+    build_index-style map from a page to (bit, bitmask of the pages that
+    must come before it). Among pages that are free to go next, the one
+    earliest in the row wins, so rows that already pass come back unchanged.
+    Returns None if the row's rules form a cycle and no order exists.
+    """
+    pending = list(dict.fromkeys(row))  # distinct pages, in row order
+    remaining = 0
+    for page in pending:
+        remaining |= before.get(page, UNRULED)[0]
 
-# Step 2: Read the pages
-def read_pages(file_path):
-    pages = []
-    with open(file_path, "r") as file:
-        for line in file:
-            stripped_line = line.strip()
-            if stripped_line:  # Skip empty lines
-                pages.append(list(map(int, stripped_line.split(","))))
-    return pages
+    ordered = []
+    while pending:
+        for i, page in enumerate(pending):
+            bit, needs = before.get(page, UNRULED)
+            if not needs & remaining:
+                ordered.extend([page] * row.count(page))
+                remaining &= ~bit
+                del pending[i]
+                break
+        else:
+            return None
+    return ordered
 
 
-# Step 3: Check rules for each row
 def check_rules(pages, rules):
     results = []
     sums = []
-    
+
+    before = build_index((right, left) for left, right in rules)
+
     for row in pages:
-        satisfies_all = False
-        middle_value = 0
-        
-        while not satisfies_all:
-            satisfies_all = True  # Assume all rules are satisfied until proven otherwise
-            
-            for left, right in rules:
-                try:
-                    left_index = row.index(left)
-                    right_index = row.index(right)
-                    
-                    if left_index > right_index:
-                        # If the rule is not satisfied, swap the values
-                        left_value = row[left_index]
-                        right_value = row[right_index]
-                        row[left_index] = right_value
-                        row[right_index] = left_value
-                        
-                        satisfies_all = False  # Rule not satisfied, need to check again
-                        break  # Restart the rules from the beginning after a swap
-                except ValueError:
-                    # If either left or right is not in the row, ignore this rule
-                    continue
-            
-        results.append(satisfies_all)
-        sums.append(row[len(row) // 2])
-    
-    return results, sums
+        ordered = reorder_row(row, before)
+        if ordered is None:
+            # Cyclic rules: there is no valid order, so no middle page either
+            results.append(False)
+            sums.append(0)
+            continue
 
+        results.append(True)
+        sums.append(ordered[len(ordered) // 2])
+
+    return results, sums
 
 
 # Main logic
@@ -0,0 +1,86 @@
+from main import check_row, load_index, index_file, pages_file, rules_file
+from reader import iter_pages, read_pages
+from main2 import reorder_row
+
+
+def invert_index(index):
+    """
+    Turn a page -> (bit, successors) index into page -> (bit, predecessors),
+    keeping each page's bit.
+    """
+    page_of = {bit: page for page, (bit, _) in index.items()}
+    before = dict.fromkeys(index, 0)
+    for page, (bit, mask) in index.items():
+        while mask:
+            low = mask & -mask
+            before[page_of[low]] |= bit
+            mask ^= low
+    return {page: (index[page][0], mask) for page, mask in before.items()}
+
+
+def classify_rows(pages, index):
+    """
+    Split rows into (valid, invalid) lists in a single pass.
+    """
+    valid = []
+    invalid = []
+    for row in pages:
+        (valid if check_row(row, index) else invalid).append(row)
+    return valid, invalid
+
+
+def run_pipeline(rules_path=rules_file, pages_path=pages_file, cache_path=index_file, stream=False):
+    """
+    Solve both parts in one go: parse the rules and updates once, sum the
+    middle pages of valid rows (part 1) and repair only the invalid rows to
+    sum their middle pages (part 2). With stream=True rows are read and
+    handled one at a time, so the update file never has to fit in memory.
+    """
+    index = load_index(rules_path, cache_path)
+    before = invert_index(index)
+
+    totals = {
+        "total_rows": 0,
+        "valid_rows": 0,
+        "repaired_rows": 0,
+        "cyclic_rows": 0,
+        "valid_sum": 0,
+        "repaired_sum": 0,
+    }
+
+    def repair(row):
+        ordered = reorder_row(row, before)
+        if ordered is None:
+            totals["cyclic_rows"] += 1
+        else:
+            totals["repaired_rows"] += 1
+            totals["repaired_sum"] += ordered[len(ordered) // 2]
+
+    if stream:
+        for row in iter_pages(pages_path):
+            totals["total_rows"] += 1
+            if check_row(row, index):
+                totals["valid_rows"] += 1
+                totals["valid_sum"] += row[len(row) // 2]
+            else:
+                repair(row)
+        return totals
+
+    pages = read_pages(pages_path)
+    valid, invalid = classify_rows(pages, index)
+    totals["total_rows"] = len(pages)
+    totals["valid_rows"] = len(valid)
+    totals["valid_sum"] = sum(row[len(row) // 2] for row in valid)
+    for row in invalid:
+        repair(row)
+    return totals
+
+
+# Main logic
+if __name__ == "__main__":
+    totals = run_pipeline()
+
+    print(f"Rows: {totals['total_rows']} ({totals['valid_rows']} valid, "
+          f"{totals['repaired_rows']} repaired, {totals['cyclic_rows']} cyclic)")
+    print(f"Part 1 sum is {totals['valid_sum']}")
+    print(f"Part 2 sum is {totals['repaired_sum']}")
@@ -0,0 +1,48 @@
+# Shared readers for the rules and update files. Everything is a generator,
+# so callers can fold rules into an index or check updates row by row
+# without holding a whole file in memory.
+#
+# Both readers also accept the combined puzzle input (rules, a blank line,
+# then updates) in a single file: pass the same path to each.
+
+
+# Rules
+def iter_rules(file_path):
+    """
+    Yield (left, right) pairs from "left|right" lines. Stops at the end of
+    the rules section of a combined input file.
+    """
+    seen_rule = False
+    with open(file_path, "r") as file:
+        for line in file:
+            stripped_line = line.strip()
+            if not stripped_line:
+                if seen_rule:
+                    break  # Blank line ends the rules section
+                continue
+            if "|" not in stripped_line:
+                break  # Updates started without a separating blank line
+            left, right = map(int, stripped_line.split("|"))
+            seen_rule = True
+            yield left, right
+
+
+def read_rules(file_path):
+    return list(iter_rules(file_path))
+
+
+# Pages
+def iter_pages(file_path):
+    """
+    Yield update rows one at a time, skipping blank lines and, in a combined
+    input file, the rule lines.
+    """
+    with open(file_path, "r") as file:
+        for line in file:
+            stripped_line = line.strip()
+            if stripped_line and "|" not in stripped_line:
+                yield list(map(int, stripped_line.split(",")))
+
+
+def read_pages(file_path):
+    return list(iter_pages(file_path))
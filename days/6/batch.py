@@ -0,0 +1,103 @@
+import argparse
+import csv
+import glob
+import json
+import os
+import sys
+import time
+from typing import Dict, List, Optional
+
+from engine import MazeEngine
+
+FIELDS = [
+    "maze", "width", "height",
+    "unique_tiles", "steps", "part1_seconds",
+    "candidates", "moves_simulated", "loops", "part2_seconds",
+    "total_seconds",
+]
+
+
+def find_mazes(pattern: str) -> List[str]:
+    """A directory means every .txt file in it; anything else is a glob"""
+    if os.path.isdir(pattern):
+        pattern = os.path.join(pattern, "*.txt")
+    return sorted(glob.glob(pattern))
+
+
+def solve(engine: MazeEngine, workers: Optional[int] = None) -> Dict:
+    """
+    Solve both parts of one maze headless and time them. steps is the
+    length of the guard's unobstructed walk, candidates the number of
+    extra-wall positions part 2 had to try and moves_simulated the guard
+    moves part 2 walked across all of them.
+    """
+    part1_start = time.perf_counter()
+    unique_tiles, steps = engine.walk_path()
+    part1_seconds = time.perf_counter() - part1_start
+
+    part2_start = time.perf_counter()
+    cycle_walls, first_entry, moves_simulated = engine.find_cycle_walls(workers)
+    part2_seconds = time.perf_counter() - part2_start
+
+    return {
+        "width": engine.width,
+        "height": engine.height,
+        "unique_tiles": unique_tiles,
+        "steps": steps,
+        "part1_seconds": round(part1_seconds, 6),
+        "candidates": len(first_entry),
+        "moves_simulated": moves_simulated,
+        "loops": len(cycle_walls),
+        "part2_seconds": round(part2_seconds, 6),
+    }
+
+
+def run_maze(path: str, workers: Optional[int] = None) -> Dict:
+    start = time.perf_counter()
+    row = {"maze": path}
+    row.update(solve(MazeEngine.from_file(path), workers))
+    row["total_seconds"] = round(time.perf_counter() - start, 6)
+    return row
+
+
+def write_report(rows: List[Dict], out: Optional[str], fmt: str):
+    file = open(out, "w", newline="") if out else sys.stdout
+    try:
+        if fmt == "csv":
+            writer = csv.DictWriter(file, fieldnames=FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+        else:
+            json.dump(rows, file, indent=2)
+            file.write("\n")
+    finally:
+        if out:
+            file.close()
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Run Day 6 parts 1 and 2 headless over many mazes")
+    parser.add_argument("mazes", nargs="+", help="maze files, directories or glob patterns")
+    parser.add_argument("--out", help="report file (default: stdout)")
+    parser.add_argument("--format", choices=["json", "csv"],
+                        help="report format (default: from --out's extension, else json)")
+    parser.add_argument("--workers", type=int, nargs="?", const=0,
+                        help="search part 2 with N processes (alone: one per core)")
+    args = parser.parse_args(argv)
+
+    fmt = args.format or ("csv" if args.out and args.out.endswith(".csv") else "json")
+    paths = [path for pattern in args.mazes for path in find_mazes(pattern)]
+    if not paths:
+        parser.error("no maze files matched")
+
+    rows = []
+    for path in paths:
+        row = run_maze(path, args.workers)
+        print(f"{path}: {row['unique_tiles']} tiles, {row['loops']} loops "
+              f"in {row['total_seconds']:.3f}s", file=sys.stderr)
+        rows.append(row)
+    write_report(rows, args.out, fmt)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import json
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from batch import solve
+from engine import MazeEngine
+from generate import generate_maze, open_exit
+
+SIZES = [130, 500, 2000, 10000]
+
+
+def bench_size(size: int, density: float, seed: int) -> dict:
+    """
+    Generate one size x size maze and time both parts on it. A maze where
+    the guard loops without any added wall is degenerate (part 2 would
+    only time the setup), so it is reported and not solved.
+    """
+    start = time.perf_counter()
+    grid = generate_maze(size, density=density, seed=seed, escape=False)
+    walls_opened = open_exit(grid)
+    row = {"size": size, "density": density, "seed": seed,
+           "generate_seconds": round(time.perf_counter() - start, 6),
+           "walls_opened": walls_opened}
+    engine = MazeEngine(grid)
+    if engine.simulate_path(grid).forms_cycle:
+        row["error"] = "degenerate: the guard loops without an added wall"
+        return row
+    row.update(solve(engine))
+    # ru_maxrss is in kilobytes on Linux
+    row["peak_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024
+    return row
+
+
+def bench_isolated(size: int, density: float, seed: int) -> dict:
+    """
+    Run one size in its own process, so peak memory is per size and a size
+    that runs out of memory is reported instead of ending the run.
+    """
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        try:
+            return pool.submit(bench_size, size, density, seed).result()
+        except (BrokenProcessPool, MemoryError) as e:
+            return {"size": size, "density": density, "seed": seed,
+                    "error": type(e).__name__}
+
+
+if __name__ == "__main__":
+    # bench.py [SIZE,...] [DENSITY] [SEED]; one JSON object per line on stdout
+    sizes = [int(size) for size in sys.argv[1].split(",")] if len(sys.argv) > 1 else SIZES
+    density = float(sys.argv[2]) if len(sys.argv) > 2 else 0.05
+    seed = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+
+    for size in sizes:
+        print(f"Benchmarking {size}x{size}...", file=sys.stderr)
+        print(json.dumps(bench_isolated(size, density, seed)), flush=True)
@@ -0,0 +1,220 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+from grid import WALL, MazeGrid
+from obstacles import ObstacleTable, walk_jumps
+from parallel import evaluate_candidates
+
+# Guard logic for Day 6 with no pygame import, so batch runs start fast and
+# work without a display. main.py and main2.py draw on top of MazeEngine.
+
+
+@dataclass
+class CycleResult:
+    forms_cycle: bool
+    steps_before_cycle: int
+    cycle_length: int
+    visited_positions: Set[Tuple[int, int]]
+    moves_simulated: int = 0
+
+
+class MazeEngine:
+    def __init__(self, grid: MazeGrid):
+        self.grid = grid
+        self.height = grid.height
+        self.width = grid.width
+        self.directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]  # up, right, down, left
+
+    @classmethod
+    def from_file(cls, filename: str) -> "MazeEngine":
+        return cls(cls.load_maze(filename))
+
+    @staticmethod
+    def load_maze(filename: str) -> MazeGrid:
+        return MazeGrid.load(filename)
+
+    def find_player(self, grid: Optional[MazeGrid] = None) -> Tuple[int, int]:
+        return (self.grid if grid is None else grid).start
+
+    def get_initial_direction(self, grid: Optional[MazeGrid] = None) -> int:
+        return (self.grid if grid is None else grid).start_direction
+
+    def is_valid_position(self, pos: Tuple[int, int]) -> bool:
+        y, x = pos
+        return 0 <= y < self.height and 0 <= x < self.width
+
+    def state_index(self, pos: Tuple[int, int], direction: int) -> int:
+        """Flat index of a (y, x, direction) guard state"""
+        return (pos[0] * self.width + pos[1]) * 4 + direction
+
+    def step_guard(self, grid: MazeGrid, pos: Tuple[int, int], direction: int) -> Tuple[Optional[Tuple[int, int]], int]:
+        """
+        Advance the guard by one turn or one move. Returns the new
+        (pos, direction), with pos None once the guard walks off the grid.
+        """
+        dy, dx = self.directions[direction]
+        new_pos = (pos[0] + dy, pos[1] + dx)
+        if not self.is_valid_position(new_pos):
+            return None, direction
+        if grid.cells[new_pos[0] * self.width + new_pos[1]] == WALL:
+            return pos, (direction + 1) % 4
+        return new_pos, direction
+
+    def measure_cycle(self, grid: MazeGrid, pos: Tuple[int, int], direction: int) -> int:
+        """Number of moves it takes to come back to a state known to be on a cycle"""
+        start = (pos, direction)
+        moves = 0
+        while True:
+            new_pos, direction = self.step_guard(grid, pos, direction)
+            if new_pos != pos:
+                moves += 1
+            pos = new_pos
+            if (pos, direction) == start:
+                return moves
+
+    def simulate_path(self, grid: MazeGrid, max_steps: Optional[int] = None,
+                      start: Optional[Tuple[Tuple[int, int], int, int]] = None) -> CycleResult:
+        """
+        Walk the guard until they leave the grid or repeat a (y, x, direction)
+        state, which means they are stuck in a loop. Seen states are
+        state_index values in a set, so the cost follows the path, not the
+        grid. start is an optional (pos, direction, step) to resume from
+        instead of the player's starting tile, and max_steps an optional cap
+        on moves.
+
+        Steps count moves, not turns. For a cycle, steps_before_cycle is the
+        step the guard first enters the loop on and cycle_length the number
+        of moves around it. When resuming, the loop is timed from the resume
+        state onwards.
+        """
+        if start is None:
+            pos = self.find_player(grid)
+            direction = self.get_initial_direction(grid)
+            step = 0
+        else:
+            pos, direction, step = start
+        
+        seen_states = set()
+        visited_positions = set()
+        
+        while max_steps is None or step < max_steps:
+            state = self.state_index(pos, direction)
+            if state in seen_states:
+                cycle_length = self.measure_cycle(grid, pos, direction)
+                return CycleResult(True, step - cycle_length, cycle_length, visited_positions)
+            seen_states.add(state)
+            visited_positions.add(pos)
+            
+            new_pos, direction = self.step_guard(grid, pos, direction)
+            
+            # Check for exit
+            if new_pos is None:
+                return CycleResult(False, step, 0, visited_positions)
+            
+            if new_pos != pos:
+                pos = new_pos
+                step += 1
+        
+        return CycleResult(True, max_steps, 0, visited_positions)
+
+    def first_entry_states(self, grid: MazeGrid) -> Dict[Tuple[int, int], Tuple[Tuple[int, int], int, int]]:
+        """
+        Walk the unobstructed path once and record, for every tile the guard
+        steps onto, the (pos, direction, step) just before they first do so.
+        A wall placed on that tile cannot change anything before that state.
+        """
+        pos = self.find_player(grid)
+        direction = self.get_initial_direction(grid)
+        first_entry = {}
+        seen = {pos}
+        
+        seen_states = set()
+        step = 0
+        while self.state_index(pos, direction) not in seen_states:
+            seen_states.add(self.state_index(pos, direction))
+            new_pos, new_direction = self.step_guard(grid, pos, direction)
+            if new_pos is None:
+                break
+            if new_pos != pos:
+                if new_pos not in seen:
+                    seen.add(new_pos)
+                    first_entry[new_pos] = (pos, direction, step)
+                step += 1
+            pos, direction = new_pos, new_direction
+        
+        # Either the guard left, or the unobstructed maze already loops and
+        # every path tile has been seen
+        return first_entry
+
+    def simulate_jumps(self, table: ObstacleTable,
+                       start: Optional[Tuple[Tuple[int, int], int, int]] = None,
+                       wall: Optional[Tuple[int, int]] = None) -> CycleResult:
+        """
+        Same outcome as simulate_path, but each straight run is one lookup in
+        the obstacle table, so the cost is the number of turns rather than
+        the path length. Loops are detected on the (y, x, direction) state at
+        each turn, so steps_before_cycle is the step of the first turn on the
+        loop. visited_positions is left empty; moves_simulated counts the
+        moves walked, loop measurement included. wall is an optional extra
+        wall to overlay on the table.
+        """
+        if start is None:
+            pos = self.find_player(self.grid)
+            direction = self.get_initial_direction(self.grid)
+            step = 0
+        else:
+            pos, direction, step = start
+        
+        forms_cycle, step, cycle_length, moves = walk_jumps(table, pos, direction, step, wall)
+        return CycleResult(forms_cycle, step, cycle_length, set(), moves)
+
+    def walk_path(self) -> Tuple[int, int]:
+        """
+        Walk the whole unobstructed path, one obstacle-table lookup per
+        straight run. Returns (unique tiles visited, total steps). Stops
+        early if the guard ends up in a loop.
+        """
+        table = ObstacleTable(self.grid)
+        pos = self.find_player()
+        direction = self.get_initial_direction(self.grid)
+        visited = {pos}
+        seen_states = set()
+        total_steps = 0
+        while self.state_index(pos, direction) not in seen_states:
+            seen_states.add(self.state_index(pos, direction))
+            stop, moves = table.next_stop(pos, direction)
+            dy, dx = self.directions[direction]
+            for i in range(1, moves + 1):
+                visited.add((pos[0] + dy * i, pos[1] + dx * i))
+            total_steps += moves
+            if stop is None:
+                break
+            pos, direction = stop, (direction + 1) % 4
+        return len(visited), total_steps
+
+    def find_cycle_walls(self, workers: Optional[int] = None) -> Tuple[List[Tuple[int, int]], Dict[Tuple[int, int], Tuple[Tuple[int, int], int, int]], int]:
+        """
+        Return every tile where one extra wall traps the guard in a loop,
+        along with the first_entry_states used to test them and the total
+        number of moves simulated across all candidates. With workers
+        set, candidates are spread over that many processes (0 means one
+        per core).
+
+        A new wall only matters if the guard would walk into it, so only the
+        tiles of the original path (minus the start) are candidates. Each try
+        resumes just before the guard first reaches the candidate, with the
+        wall overlaid on one read-only obstacle table.
+        """
+        first_entry = self.first_entry_states(self.grid)
+        candidates = [(y, x, start) for (y, x), start in first_entry.items()]
+        if workers is not None:
+            outcomes = evaluate_candidates(self.grid, candidates, workers or None)
+        else:
+            table = ObstacleTable(self.grid)
+            outcomes = []
+            for y, x, start in candidates:
+                result = self.simulate_jumps(table, start=start, wall=(y, x))
+                outcomes.append((result.forms_cycle, result.moves_simulated))
+        
+        cycle_walls = [(y, x) for (y, x, _), (hit, _) in zip(candidates, outcomes) if hit]
+        return cycle_walls, first_entry, sum(moves for _, moves in outcomes)
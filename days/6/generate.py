@@ -0,0 +1,98 @@
+import os
+import sys
+
+import numpy as np
+
+from grid import OPEN, WALL, MazeGrid
+
+GUARD = ord("^")
+BLOCK_CELLS = 1 << 20
+DIRECTIONS = [(-1, 0), (0, 1), (1, 0), (0, -1)]  # up, right, down, left
+
+
+def open_exit(grid: MazeGrid) -> int:
+    """
+    Remove walls until the guard's unobstructed walk leaves the grid, and
+    return how many were removed. A random maze usually traps the guard in
+    a loop, and then part 2 has nothing to find.
+
+    When the guard turns in a state it turned in before, the wall it faces
+    goes. The walk before that wall was first hit does not change, so it
+    resumes from there rather than from the start.
+    """
+    width, cells = grid.width, grid.cells
+    pos, direction = grid.start, grid.start_direction
+    turns = []  # (state, wall cell) per turn, in order
+    seen = {}  # state -> index in turns
+    removed = 0
+    while True:
+        dy, dx = DIRECTIONS[direction]
+        y, x = pos
+        while True:
+            ny, nx = y + dy, x + dx
+            if not grid.in_bounds(ny, nx):
+                return removed
+            if cells[ny * width + nx] == WALL:
+                break
+            y, x = ny, nx
+        pos, wall = (y, x), ny * width + nx
+        state = (pos, direction)
+
+        if state in seen:
+            cells[wall] = OPEN
+            removed += 1
+            first = next(i for i, (_, hit) in enumerate(turns) if hit == wall)
+            for old_state, _ in turns[first:]:
+                del seen[old_state]
+            pos, direction = turns[first][0]
+            del turns[first:]
+            continue
+
+        seen[state] = len(turns)
+        turns.append((state, wall))
+        direction = (direction + 1) % 4
+
+
+def generate_maze(width: int, height: int = None, density: float = 0.05, seed: int = 0,
+                  escape: bool = True) -> MazeGrid:
+    """
+    A random guard maze: each cell is a wall with probability density, and
+    the guard starts facing up from the middle of the grid. The same seed
+    always gives the same maze. With escape, walls are opened (open_exit)
+    until the guard's unobstructed walk leaves the grid, as in the puzzle.
+    """
+    height = width if height is None else height
+    rng = np.random.default_rng(seed)
+    cells = bytearray(width * height)
+    view = np.frombuffer(cells, dtype=np.uint8)
+    # Draw in blocks to keep the float temporaries small; the stream is
+    # the same as one big draw
+    for start in range(0, len(cells), BLOCK_CELLS):
+        block = view[start:start + BLOCK_CELLS]
+        block[:] = np.where(rng.random(block.size) < density, WALL, OPEN)
+    cells[(height // 2) * width + width // 2] = GUARD
+    grid = MazeGrid(cells, width, height)
+    if escape:
+        open_exit(grid)
+    return grid
+
+
+def write_maze(grid: MazeGrid, path: str):
+    with open(path, "w") as file:
+        file.write(str(grid))
+        file.write("\n")
+
+
+if __name__ == "__main__":
+    # generate.py OUT_DIR [SIZE,...] [COUNT] [DENSITY]: a corpus for batch.py
+    out_dir = sys.argv[1] if len(sys.argv) > 1 else "mazes"
+    sizes = [int(size) for size in sys.argv[2].split(",")] if len(sys.argv) > 2 else [130]
+    count = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+    density = float(sys.argv[4]) if len(sys.argv) > 4 else 0.05
+
+    os.makedirs(out_dir, exist_ok=True)
+    for size in sizes:
+        for seed in range(count):
+            path = os.path.join(out_dir, f"maze_{size}_{seed}.txt")
+            write_maze(generate_maze(size, density=density, seed=seed), path)
+            print(f"Wrote {path}")
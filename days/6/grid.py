@@ -0,0 +1,64 @@
+from typing import Tuple
+
+WALL = ord("#")
+OPEN = ord(".")
+PLAYER_DIRECTIONS = {ord("^"): 0, ord(">"): 1, ord("v"): 2, ord("<"): 3}
+
+
+class MazeGrid:
+    """
+    A maze stored as one flat bytearray, one byte per cell, addressed as
+    y * width + x. The guard's start tile and direction are found once.
+    """
+
+    def __init__(self, cells: bytearray, width: int, height: int):
+        if len(cells) != width * height:
+            raise ValueError(f"Expected {width * height} cells, got {len(cells)}")
+        self.cells = cells
+        self.width = width
+        self.height = height
+        self.start, self.start_direction = self.find_start()
+
+    @classmethod
+    def from_lines(cls, lines) -> "MazeGrid":
+        rows = [line.strip() for line in lines]
+        rows = [row for row in rows if row]
+        width = len(rows[0])
+        for y, row in enumerate(rows):
+            if len(row) != width:
+                raise ValueError(f"Row {y} has {len(row)} characters, expected {width}")
+        return cls(bytearray(b"".join(rows)), width, len(rows))
+
+    @classmethod
+    def load(cls, filename: str) -> "MazeGrid":
+        with open(filename, "rb") as file:
+            return cls.from_lines(file)
+
+    def find_start(self) -> Tuple[Tuple[int, int], int]:
+        for char, direction in PLAYER_DIRECTIONS.items():
+            index = self.cells.find(char)
+            if index >= 0:
+                return divmod(index, self.width), direction
+        raise ValueError("No player found in maze")
+
+    def in_bounds(self, y: int, x: int) -> bool:
+        return 0 <= y < self.height and 0 <= x < self.width
+
+    def is_wall(self, y: int, x: int) -> bool:
+        return self.cells[y * self.width + x] == WALL
+
+    def set_cell(self, y: int, x: int, value: int) -> int:
+        """Overwrite one cell and return what was there, for cheap undo"""
+        index = y * self.width + x
+        previous = self.cells[index]
+        self.cells[index] = value
+        return previous
+
+    def as_array(self):
+        """The cells as a (height, width) NumPy uint8 view, sharing memory"""
+        import numpy as np
+        return np.frombuffer(self.cells, dtype=np.uint8).reshape(self.height, self.width)
+
+    def __str__(self) -> str:
+        return "\n".join(self.cells[y * self.width:(y + 1) * self.width].decode()
+                         for y in range(self.height))
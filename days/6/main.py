@@ -1,20 +1,21 @@
 import pygame
 import sys
-import random
 from typing import List, Tuple, Optional, Set
 from pathlib import Path
 
+from engine import MazeEngine
+from sounds import SoundBank
 
-class MazePathfinder:
+
+class MazePathfinder(MazeEngine):
     def __init__(self, filename: str):
+        super().__init__(self.load_maze(filename))
+
         pygame.init()
         pygame.mixer.init()
 
         self.sounds = self.load_sounds()
 
-        self.grid = self.load_maze(filename)
-        self.height = len(self.grid)
-        self.width = len(self.grid[0])
         self.cell_size = 6
 
         # Calculate window height to accommodate controls and counters
@@ -44,10 +45,13 @@ class MazePathfinder:
         self.total_steps = 0  # Keep track of total steps for comparison
         self.running = False
 
-        # Speed control
+        # Speed control, in steps per second. Frames are capped at max_fps
+        # and faster speeds take several steps per frame.
         self.min_speed = 1
-        self.max_speed = 500
+        self.max_speed = 5000
+        self.max_fps = 60
         self.speed = 10
+        self.step_budget = 0.0  # steps owed, carried between frames
         self.slider_rect = pygame.Rect(70, window_height - 40, 200, 10)
         self.slider_handle_rect = pygame.Rect(0, 0, 20, 20)
         self.update_slider_handle()
@@ -56,7 +60,17 @@ class MazePathfinder:
         # Font for counters
         self.font = pygame.font.Font(None, 24)
 
-        self.directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+        # Incremental rendering state, see draw()
+        maze_pixels = self.width * self.cell_size
+        self.maze_surface: Optional[pygame.Surface] = None
+        self.new_tiles: List[Tuple[int, int]] = []
+        self.last_player_rect = self.cell_rect(self.player_pos)
+        self.button_rect = pygame.Rect(10, 10, 50, 30)
+        self.counters_rect = pygame.Rect(maze_pixels - 150, 10, 150, 50)
+        self.controls_rect = pygame.Rect(
+            0, self.height * self.cell_size, maze_pixels,
+            window_height - self.height * self.cell_size,
+        )
 
     def update_slider_handle(self):
         # Calculate handle position based on speed
@@ -65,67 +79,24 @@ class MazePathfinder:
         self.slider_handle_rect.center = (handle_x, self.slider_rect.centery)
 
     def play_sound_with_variance(self, sound_key: str):
-        """Play a sound with random pitch variance"""
-        sound = self.sounds[sound_key]
-        # Random pitch between 0.9 and 1.1
-        pitch = random.uniform(0.9, 1.1)
-        # Unfortunately, pygame.mixer.Sound doesn't support pitch shifting directly
-        # So we'll use a channel to control playback speed which affects pitch
-        channel = pygame.mixer.find_channel()
-        if channel:
-            channel.play(sound)
-            # Note: This is a simplified approach - for more precise pitch control,
-            # you might want to use a library like sounddevice or pygame.sndarray
-
-    def load_sounds(self) -> dict:
-        """Load and return dictionary of sound effects"""
-        sounds = {}
-        try:
-            sounds["step"] = pygame.mixer.Sound("step.wav")
-            sounds["step"].set_volume(0.2)
-
-            sounds["collision"] = pygame.mixer.Sound("collision.wav")
-            sounds["collision"].set_volume(0.5)
-
-            sounds["victory"] = pygame.mixer.Sound("victory.wav")
-            sounds["victory"].set_volume(0.7)
-        except FileNotFoundError as e:
-            print(f"Warning: Could not load sound file: {e}")
-            empty_sound = pygame.mixer.Sound(buffer=bytes([]))
-            sounds = {
-                "step": empty_sound,
-                "collision": empty_sound,
-                "victory": empty_sound,
-            }
-        return sounds
-
-    def load_maze(self, filename: str) -> List[List[str]]:
-        with open(filename, "r") as file:
-            return [list(line.strip()) for line in file]
-
-    def find_player(self) -> Tuple[int, int]:
-        for y in range(self.height):
-            for x in range(self.width):
-                if self.grid[y][x] in "^>v<":
-                    return (y, x)
-        raise ValueError("No player found in maze")
-
-    def get_initial_direction(self) -> int:
-        direction_chars = {"^": 0, ">": 1, "v": 2, "<": 3}
-        return direction_chars[self.grid[self.player_pos[0]][self.player_pos[1]]]
-
-    def is_valid_position(self, pos: Tuple[int, int]) -> bool:
-        y, x = pos
-        return 0 <= y < self.height and 0 <= x < self.width
+        """Queue a random pre-rendered pitch variant; draw() flushes the queue"""
+        self.sounds.play(sound_key)
+
+    def load_sounds(self) -> SoundBank:
+        """Load sound effects and pre-render their pitch variants"""
+        return SoundBank(
+            {"step": "step.wav", "collision": "collision.wav", "victory": "victory.wav"},
+            {"step": 0.2, "collision": 0.5, "victory": 0.7},
+            one_shots=["victory"],
+        )
 
     def move_player(self) -> bool:
         if not self.running:
             return True
 
-        dy, dx = self.directions[self.player_direction]
-        new_pos = (self.player_pos[0] + dy, self.player_pos[1] + dx)
+        new_pos, new_direction = self.step_guard(self.grid, self.player_pos, self.player_direction)
 
-        if not self.is_valid_position(new_pos):
+        if new_pos is None:
             final_message = (
                 f"Maze completed!\n"
                 f"Unique tiles visited: {len(self.visited_tiles)}\n"
@@ -136,50 +107,93 @@ class MazePathfinder:
             self.running = False
             return False
 
-        if self.grid[new_pos[0]][new_pos[1]] == "#":
+        if new_pos == self.player_pos:
             self.play_sound_with_variance("collision")
-            self.player_direction = (self.player_direction + 1) % 4
+            self.player_direction = new_direction
             return True
 
         self.play_sound_with_variance("step")
         self.player_pos = new_pos
+        if new_pos not in self.visited_tiles:
+            self.new_tiles.append(new_pos)
         self.visited_tiles.add(new_pos)  # Add to set of unique positions
         self.total_steps += 1  # Increment total step counter
         return True
 
-    def draw(self):
-        self.screen.fill(self.COLORS["background"])
+    def cell_rect(self, pos: Tuple[int, int]) -> pygame.Rect:
+        return pygame.Rect(
+            pos[1] * self.cell_size,
+            pos[0] * self.cell_size,
+            self.cell_size,
+            self.cell_size,
+        )
 
-        # Draw maze
+    def render_maze_surface(self) -> pygame.Surface:
+        """Draw walls and the path so far once; later frames only add tiles"""
+        surface = pygame.Surface(
+            (self.width * self.cell_size, self.height * self.cell_size)
+        )
+        surface.fill(self.COLORS["background"])
         for y in range(self.height):
             for x in range(self.width):
-                rect = pygame.Rect(
-                    x * self.cell_size,
-                    y * self.cell_size,
-                    self.cell_size,
-                    self.cell_size,
-                )
-
-                if self.grid[y][x] == "#":
-                    pygame.draw.rect(self.screen, self.COLORS["wall"], rect)
+                if self.grid.is_wall(y, x):
+                    pygame.draw.rect(surface, self.COLORS["wall"], self.cell_rect((y, x)))
                 elif (y, x) in self.visited_tiles:
-                    pygame.draw.rect(self.screen, self.COLORS["path"], rect)
+                    pygame.draw.rect(surface, self.COLORS["path"], self.cell_rect((y, x)))
+        return surface
+
+    def frame_rate(self) -> int:
+        return min(self.speed, self.max_fps)
+
+    def steps_per_frame(self) -> int:
+        """
+        Steps to run this frame. Above max_fps the simulation runs several
+        steps between frames; the fractional part carries over, so the
+        average matches the speed shown on the slider.
+        """
+        self.step_budget += self.speed / self.frame_rate()
+        steps = int(self.step_budget)
+        self.step_budget -= steps
+        return steps
+
+    def draw(self):
+        """
+        Redraw only what changed: new path tiles go onto the persistent maze
+        surface, and just those cells, the player's old and new cell and the
+        overlays are copied to the screen.
+        """
+        if self.maze_surface is None:
+            self.maze_surface = self.render_maze_surface()
+            self.screen.fill(self.COLORS["background"])
+            self.screen.blit(self.maze_surface, (0, 0))
+            dirty = [self.screen.get_rect()]
+        else:
+            dirty = []
+
+        for pos in self.new_tiles:
+            rect = self.cell_rect(pos)
+            pygame.draw.rect(self.maze_surface, self.COLORS["path"], rect)
+            dirty.append(rect)
+        self.new_tiles.clear()
+
+        # Overlays sit on top of the maze, so restore what is under them
+        dirty.extend([self.last_player_rect, self.button_rect, self.counters_rect])
+        for rect in dirty:
+            self.screen.blit(self.maze_surface, rect, rect)
 
         # Draw player
-        player_rect = pygame.Rect(
-            self.player_pos[1] * self.cell_size,
-            self.player_pos[0] * self.cell_size,
-            self.cell_size,
-            self.cell_size,
-        )
+        player_rect = self.cell_rect(self.player_pos)
         pygame.draw.rect(self.screen, self.COLORS["player"], player_rect)
+        self.last_player_rect = player_rect
+        dirty.append(player_rect)
 
         # Draw GO button
         if not self.running:
-            button_rect = pygame.Rect(10, 10, 50, 30)
-            pygame.draw.rect(self.screen, self.COLORS["button"], button_rect)
+            pygame.draw.rect(self.screen, self.COLORS["button"], self.button_rect)
 
         # Draw speed slider and label
+        self.screen.fill(self.COLORS["background"], self.controls_rect)
+        dirty.append(self.controls_rect)
         pygame.draw.rect(self.screen, self.COLORS["slider"], self.slider_rect)
         pygame.draw.rect(
             self.screen, self.COLORS["slider_handle"], self.slider_handle_rect
@@ -206,7 +220,8 @@ class MazePathfinder:
         self.screen.blit(unique_tiles_text, (self.width * self.cell_size - 150, 10))
         self.screen.blit(total_steps_text, (self.width * self.cell_size - 150, 35))
 
-        pygame.display.flip()
+        pygame.display.update(dirty)
+        self.sounds.flush()
 
     def handle_slider_interaction(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN:
@@ -235,15 +250,17 @@ class MazePathfinder:
                 self.handle_slider_interaction(event)
 
                 if event.type == pygame.MOUSEBUTTONDOWN and not self.running:
-                    if pygame.Rect(10, 10, 50, 30).collidepoint(event.pos):
+                    if self.button_rect.collidepoint(event.pos):
                         self.running = True
 
             if self.running:
-                if not self.move_player():
-                    self.running = False
+                for _ in range(self.steps_per_frame()):
+                    if not self.move_player():
+                        self.running = False
+                        break
 
             self.draw()
-            clock.tick(self.speed)
+            clock.tick(self.frame_rate())
 
 
 if __name__ == "__main__":
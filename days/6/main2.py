@@ -1,29 +1,33 @@
-import pygame
 import sys
-from typing import List, Tuple, Set, Optional
-from dataclasses import dataclass
-from collections import deque
-import copy
+from typing import List, Optional, Tuple
 
-@dataclass
-class CycleResult:
-    forms_cycle: bool
-    steps_before_cycle: int
-    cycle_length: int
-    visited_positions: Set[Tuple[int, int]]
+from engine import CycleResult, MazeEngine
+from grid import WALL, MazeGrid
 
-class MazeCycleAnalyzer:
-    def __init__(self, filename: str):
-        self.original_grid = self.load_maze(filename)
-        self.height = len(self.original_grid)
-        self.width = len(self.original_grid[0])
-        self.directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]  # up, right, down, left
+# pygame is imported on first draw, so headless runs never load it
+pygame = None
+
+
+def load_pygame():
+    global pygame
+    if pygame is None:
+        import pygame as pygame_module
+        pygame = pygame_module
+    return pygame
+
+class MazeCycleAnalyzer(MazeEngine):
+    def __init__(self, filename: str, headless: bool = False):
+        super().__init__(self.load_maze(filename))
+        self.original_grid = self.grid
         
         # Visual settings
         self.cell_size = 6
-        pygame.init()
-        self.screen = pygame.display.set_mode((self.width * self.cell_size, self.height * self.cell_size))
-        pygame.display.set_caption("Cycle Analysis")
+        self.screen = None
+        if not headless:
+            load_pygame()
+            pygame.init()
+            self.screen = pygame.display.set_mode((self.width * self.cell_size, self.height * self.cell_size))
+            pygame.display.set_caption("Cycle Analysis")
         
         self.COLORS = {
             'background': (255, 255, 255),
@@ -33,97 +37,35 @@ class MazeCycleAnalyzer:
             'cycle_path': (255, 200, 200)
         }
 
-    def load_maze(self, filename: str) -> List[List[str]]:
-        with open(filename, 'r') as file:
-            return [list(line.strip()) for line in file]
-
-    def find_player(self, grid: List[List[str]]) -> Tuple[int, int]:
-        for y in range(self.height):
-            for x in range(self.width):
-                if grid[y][x] in '^>v<':
-                    return (y, x)
-        raise ValueError("No player found in maze")
-
-    def get_initial_direction(self, grid: List[List[str]], pos: Tuple[int, int]) -> int:
-        direction_chars = {'^': 0, '>': 1, 'v': 2, '<': 3}
-        return direction_chars[grid[pos[0]][pos[1]]]
-
-    def is_valid_position(self, pos: Tuple[int, int]) -> bool:
-        y, x = pos
-        return 0 <= y < self.height and 0 <= x < self.width
-
-    def simulate_path(self, grid: List[List[str]], max_steps: int = 30000) -> CycleResult:
-        pos = self.find_player(grid)
-        direction = self.get_initial_direction(grid, pos)
+    def find_cycle_inducing_walls(self, verbose: bool = True, workers: Optional[int] = None) -> List[Tuple[int, int]]:
+        """
+        Return every tile where one extra wall traps the guard in a loop.
+        With workers set, candidates are spread over that many processes
+        (0 means one per core). With verbose, each hit is re-walked cell by
+        cell for its exact step counts and drawn once the search is done.
+        """
+        cycle_walls, first_entry, _ = self.find_cycle_walls(workers)
+        print(f"Original path: {len(first_entry) + 1} unique tiles visited")
         
-        # Track position history for cycle detection
-        position_history = []
-        visited_positions = set()
-        position_to_step = {}  # Maps positions to when we first saw them
-        
-        step = 0
-        while step < max_steps:
-            position_history.append((pos, direction))
-            visited_positions.add(pos)
-            position_to_step[pos] = step
-            
-            # Calculate next position
-            dy, dx = self.directions[direction]
-            new_pos = (pos[0] + dy, pos[1] + dx)
-            
-            # Check for exit
-            if not self.is_valid_position(new_pos):
-                return CycleResult(False, step, 0, visited_positions)
-            
-            # Check for wall collision
-            if grid[new_pos[0]][new_pos[1]] == '#':
-                direction = (direction + 1) % 4
-                continue
-            
-            # Move to new position
-            pos = new_pos
-            
-            # Check for cycle
-            # cyounter = sum(1 for value in position_to_step.values() if value == pos)
-            cyounter = 1
-            if cyounter >= 2:
-                cycle_start_step = position_to_step[pos]
-                cycle_length = step - cycle_start_step
-                return CycleResult(True, cycle_start_step, cycle_length, visited_positions)
-            
-            step += 1
-        
-        return CycleResult(True, max_steps, 0, visited_positions)
-
-    def find_cycle_inducing_walls(self) -> List[Tuple[int, int]]:
-        cycle_walls = []
-        original_path_result = self.simulate_path(self.original_grid)
-        print(f"Original path: {len(original_path_result.visited_positions)} unique tiles visited")
-        
-        # Try placing a wall at each empty position
-        for y in range(self.height):
-            for x in range(self.width):
-                if self.original_grid[y][x] == '.':
-                    # Create a new grid with an additional wall
-                    test_grid = copy.deepcopy(self.original_grid)
-                    test_grid[y][x] = '#'
-                    
-                    # Simulate path with new wall
-                    result = self.simulate_path(test_grid)
-                    
-                    # If this creates a cycle, record it
-                    if result.forms_cycle:
-                        cycle_walls.append((y, x))
-                        print(f"Found cycle-inducing wall at ({y}, {x})")
-                        print(f"  Steps before cycle: {result.steps_before_cycle}")
-                        print(f"  Cycle length: {result.cycle_length}")
-                        self.visualize_cycle(test_grid, result)
+        if verbose:
+            grid = self.original_grid
+            for y, x in cycle_walls:
+                previous = grid.set_cell(y, x, WALL)
+                try:
+                    result = self.simulate_path(grid, start=first_entry[(y, x)])
+                    print(f"Found cycle-inducing wall at ({y}, {x})")
+                    print(f"  Steps before cycle: {result.steps_before_cycle}")
+                    print(f"  Cycle length: {result.cycle_length}")
+                    if self.screen is not None:
+                        self.visualize_cycle(grid, result)
                         # pygame.time.wait(100)  # Brief pause to show each cycle
                         pygame.time.wait(1)  # Brief pause to show each cycle
+                finally:
+                    grid.set_cell(y, x, previous)
         
         return cycle_walls
 
-    def visualize_cycle(self, grid: List[List[str]], result: CycleResult):
+    def visualize_cycle(self, grid: MazeGrid, result: CycleResult):
         self.screen.fill(self.COLORS['background'])
         
         # Draw the maze
@@ -132,7 +74,7 @@ class MazeCycleAnalyzer:
                 rect = pygame.Rect(x * self.cell_size, y * self.cell_size,
                                  self.cell_size, self.cell_size)
                 
-                if grid[y][x] == '#':
+                if grid.is_wall(y, x):
                     color = self.COLORS['wall']
                     pygame.draw.rect(self.screen, color, rect)
                 elif (y, x) in result.visited_positions:
@@ -142,10 +84,23 @@ class MazeCycleAnalyzer:
         pygame.display.flip()
 
 def main():
-    analyzer = MazeCycleAnalyzer("maze.txt")
-    cycle_walls = analyzer.find_cycle_inducing_walls()
+    # --headless skips the window, --workers=N searches with N processes
+    # (--workers alone uses one per core)
+    headless = "--headless" in sys.argv
+    workers = None
+    for arg in sys.argv[1:]:
+        if arg == "--workers":
+            workers = 0
+        elif arg.startswith("--workers="):
+            workers = int(arg.split("=", 1)[1])
+    
+    analyzer = MazeCycleAnalyzer("maze.txt", headless=headless)
+    cycle_walls = analyzer.find_cycle_inducing_walls(verbose=not headless, workers=workers)
     print(f"\nFound {len(cycle_walls)} cycle-inducing wall positions")
     
+    if headless:
+        return
+    
     # Keep window open
     while True:
         for event in pygame.event.get():
@@ -154,4 +109,4 @@ def main():
                 sys.exit()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
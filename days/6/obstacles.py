@@ -0,0 +1,177 @@
+from array import array
+from typing import Optional, Tuple
+
+from grid import WALL, MazeGrid
+
+UP, RIGHT, DOWN, LEFT = range(4)
+
+
+def filled(value: int, count: int) -> array:
+    return array("i", [value]) * count
+
+
+def wall_indices(line: bytes) -> list:
+    indices = []
+    index = line.find(WALL)
+    while index >= 0:
+        indices.append(index)
+        index = line.find(WALL, index + 1)
+    return indices
+
+
+class ObstacleTable:
+    """
+    For every cell and direction, the row (up/down) or column (left/right)
+    of the nearest wall in that direction, so the guard can jump straight to
+    the tile before it instead of walking one cell at a time.
+
+    Missing walls are stored as -1 (up/left) or height/width (down/right),
+    which is exactly where the guard leaves the grid. The four directions
+    are int32 views into one buffer of buffer_size bytes, 16 per cell.
+    Passing a shared memory buffer lets other processes attach() to the
+    finished table instead of building their own.
+    """
+
+    def __init__(self, grid: MazeGrid, buffer=None):
+        h, w = grid.height, grid.width
+        self._bind(bytearray(self.buffer_size(w, h)) if buffer is None else buffer, w, h)
+        cells = grid.cells
+        self.up[:] = filled(-1, h * w)
+        self.down[:] = filled(h, h * w)
+        self.left[:] = filled(-1, h * w)
+        self.right[:] = filled(w, h * w)
+
+        # Fill each run between neighbouring walls with one slice write, so
+        # the Python work follows the number of walls, not cells
+        for x in range(w):
+            above = -1
+            for wall in wall_indices(cells[x::w]) + [h]:
+                # Rows above+1..wall (the wall included) see above as the
+                # nearest wall up; rows above..wall-1 see wall down
+                end = min(wall + 1, h)
+                self.up[self._column(above + 1, end, x)] = filled(above, end - above - 1)
+                start = max(above, 0)
+                self.down[self._column(start, wall, x)] = filled(wall, wall - start)
+                above = wall
+
+        for y in range(h):
+            row = y * w
+            left = -1
+            for wall in wall_indices(cells[row:row + w]) + [w]:
+                end = min(wall + 1, w)
+                self.left[row + left + 1:row + end] = filled(left, end - left - 1)
+                start = max(left, 0)
+                self.right[row + start:row + wall] = filled(wall, wall - start)
+                left = wall
+
+    @staticmethod
+    def buffer_size(width: int, height: int) -> int:
+        return 4 * 4 * width * height
+
+    @classmethod
+    def attach(cls, buffer, width: int, height: int) -> "ObstacleTable":
+        """Wrap a buffer that already holds a built table, without copying"""
+        table = cls.__new__(cls)
+        table._bind(buffer, width, height)
+        return table
+
+    def _bind(self, buffer, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.values = memoryview(buffer).cast("i")
+        n = width * height
+        self.up, self.down, self.left, self.right = (self.values[i * n:(i + 1) * n] for i in range(4))
+
+    def release(self):
+        """Drop the views, so a shared memory block can be closed"""
+        for view in (self.up, self.down, self.left, self.right, self.values):
+            view.release()
+
+    def next_stop(self, pos: Tuple[int, int], direction: int) -> Tuple[Optional[Tuple[int, int]], int]:
+        """
+        Where the guard ends up walking straight from pos: the tile in front of
+        the next wall and the number of moves to get there, or (None, moves)
+        if they walk off the grid after that many moves.
+        """
+        y, x = pos
+        cell = y * self.width + x
+        if direction == UP:
+            wall = self.up[cell]
+            return ((wall + 1, x) if wall >= 0 else None), y - wall - 1
+        if direction == DOWN:
+            wall = self.down[cell]
+            return ((wall - 1, x) if wall < self.height else None), wall - y - 1
+        if direction == LEFT:
+            wall = self.left[cell]
+            return ((y, wall + 1) if wall >= 0 else None), x - wall - 1
+        wall = self.right[cell]
+        return ((y, wall - 1) if wall < self.width else None), wall - x - 1
+
+    def next_stop_with_wall(self, pos: Tuple[int, int], direction: int,
+                            wall: Tuple[int, int]) -> Tuple[Optional[Tuple[int, int]], int]:
+        """
+        next_stop as if there were one more wall at wall. This is the local
+        update for a candidate wall: it can only cut short a run in its own
+        row or column, so one comparison per lookup replaces rewriting the
+        table, and a read-only (shared) table can test candidates.
+        """
+        stop, moves = self.next_stop(pos, direction)
+        y, x = pos
+        wall_y, wall_x = wall
+        if direction == UP:
+            if wall_x == x and wall_y < y and (stop is None or wall_y >= stop[0]):
+                return (wall_y + 1, x), y - wall_y - 1
+        elif direction == DOWN:
+            if wall_x == x and wall_y > y and (stop is None or wall_y <= stop[0]):
+                return (wall_y - 1, x), wall_y - y - 1
+        elif direction == LEFT:
+            if wall_y == y and wall_x < x and (stop is None or wall_x >= stop[1]):
+                return (y, wall_x + 1), x - wall_x - 1
+        elif wall_y == y and wall_x > x and (stop is None or wall_x <= stop[1]):
+            return (y, wall_x - 1), wall_x - x - 1
+        return stop, moves
+
+    def _column(self, y_from: int, y_to: int, x: int) -> slice:
+        return slice(y_from * self.width + x, y_to * self.width + x, self.width)
+
+
+def walk_jumps(table: ObstacleTable, pos: Tuple[int, int], direction: int, step: int = 0,
+               wall: Optional[Tuple[int, int]] = None) -> Tuple[bool, int, int, int]:
+    """
+    Walk the guard run by run from (pos, direction), with an optional extra
+    wall laid over the table. Returns (forms_cycle, step, cycle_length,
+    moves): the step the guard leaves the grid on, or for a loop the step
+    of its first turn on the loop and the loop's length in moves, plus the
+    number of moves simulated to find that out (measuring a loop included).
+
+    Loops are caught on a repeated (y, x, direction) turn state. A walk
+    only makes a handful of turns, so they go in a set rather than a
+    buffer the size of the grid.
+    """
+    width = table.width
+    if wall is None:
+        next_stop = table.next_stop
+    else:
+        def next_stop(pos, direction):
+            return table.next_stop_with_wall(pos, direction, wall)
+    seen_states = set()
+    simulated = 0
+    while True:
+        state = (pos[0] * width + pos[1]) * 4 + direction
+        if state in seen_states:
+            loop_state = (pos, direction)
+            cycle_length = 0
+            while True:
+                pos, moves = next_stop(pos, direction)
+                direction = (direction + 1) % 4
+                cycle_length += moves
+                if (pos, direction) == loop_state:
+                    return True, step - cycle_length, cycle_length, simulated + cycle_length
+        seen_states.add(state)
+
+        stop, moves = next_stop(pos, direction)
+        step += moves
+        simulated += moves
+        if stop is None:
+            return False, step, 0, simulated
+        pos, direction = stop, (direction + 1) % 4
@@ -0,0 +1,62 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Optional, Sequence, Tuple
+
+from grid import MazeGrid
+from obstacles import ObstacleTable, walk_jumps
+
+# (y, x, (start pos, start direction, start step)) for one candidate wall
+Candidate = Tuple[int, int, Tuple[Tuple[int, int], int, int]]
+
+BATCHES_PER_WORKER = 8
+
+# Per-worker state, set up once by _init_worker
+_shm: Optional[shared_memory.SharedMemory] = None
+_table: Optional[ObstacleTable] = None
+
+
+def _init_worker(name: str, width: int, height: int):
+    """
+    Attach to the obstacle table the parent built in shared memory. Workers
+    only read it (candidate walls are overlaid, not written), so one copy
+    serves every process and nothing is rebuilt.
+    """
+    global _shm, _table
+    _shm = shared_memory.SharedMemory(name=name)
+    _table = ObstacleTable.attach(_shm.buf, width, height)
+
+
+def _evaluate_batch(batch: Sequence[Candidate]) -> List[Tuple[bool, int]]:
+    results = []
+    for y, x, (pos, direction, step) in batch:
+        forms_cycle, _, _, moves = walk_jumps(_table, pos, direction, step, (y, x))
+        results.append((forms_cycle, moves))
+    return results
+
+
+def evaluate_candidates(grid: MazeGrid, candidates: Sequence[Candidate],
+                        workers: Optional[int] = None) -> List[Tuple[bool, int]]:
+    """
+    Try every candidate wall in a process pool and return, in candidate
+    order, whether it traps the guard in a loop and how many moves the try
+    simulated. No pygame is involved, so this runs headless.
+    """
+    workers = workers or os.cpu_count() or 1
+    batch_size = max(1, -(-len(candidates) // (workers * BATCHES_PER_WORKER)))
+    batches = [candidates[i:i + batch_size] for i in range(0, len(candidates), batch_size)]
+
+    results = []
+    shm = shared_memory.SharedMemory(create=True, size=ObstacleTable.buffer_size(grid.width, grid.height))
+    try:
+        table = ObstacleTable(grid, shm.buf)
+        table.release()
+        initargs = (shm.name, grid.width, grid.height)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as pool:
+            # map() returns batches in submission order
+            for batch_result in pool.map(_evaluate_batch, batches):
+                results.extend(batch_result)
+    finally:
+        shm.close()
+        shm.unlink()
+    return results
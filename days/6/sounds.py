@@ -0,0 +1,96 @@
+import random
+from typing import Dict, Iterable, List
+
+import pygame
+
+try:
+    import numpy as np
+except ImportError:  # pitch variants need NumPy; without it every variant is the original
+    np = None
+
+VARIANTS = 8
+PITCH_RANGE = (0.9, 1.1)
+CHANNELS = 8
+MAX_PER_FRAME = 2  # sounds started per frame, however many steps the frame ran
+
+
+def pitch_shift(sound: pygame.mixer.Sound, pitch: float) -> pygame.mixer.Sound:
+    """
+    Resample a sound so it plays pitch times faster (and higher). Done once
+    at load time, so linear interpolation is plenty.
+    """
+    if np is None:
+        return sound
+    samples = pygame.sndarray.array(sound)
+    length = samples.shape[0]
+    positions = np.arange(0, length - 1, pitch)
+    if positions.size == 0:
+        return sound
+    source = np.arange(length)
+    if samples.ndim == 1:
+        shifted = np.interp(positions, source, samples)
+    else:
+        shifted = np.stack([np.interp(positions, source, samples[:, c])
+                            for c in range(samples.shape[1])], axis=1)
+    return pygame.sndarray.make_sound(np.ascontiguousarray(shifted.astype(samples.dtype)))
+
+
+class SoundBank:
+    """
+    Pre-rendered pitch variants of each effect, played on a fixed pool of
+    reserved channels. play() only queues a sound; flush() starts at most
+    MAX_PER_FRAME of them once per frame, the most recently queued first,
+    so the mixer load stays the same no matter how many steps a frame
+    simulates. Keys in one_shots (rare events like victory) skip the cap
+    and are never dropped.
+    """
+
+    def __init__(self, files: Dict[str, str], volumes: Dict[str, float],
+                 variants: int = VARIANTS, channels: int = CHANNELS,
+                 one_shots: Iterable[str] = ()):
+        self.one_shots = set(one_shots)
+        self.banks: Dict[str, List[pygame.mixer.Sound]] = {}
+        for key, path in files.items():
+            try:
+                sound = pygame.mixer.Sound(path)
+            except FileNotFoundError as e:
+                print(f"Warning: Could not load sound file: {e}")
+                sound = pygame.mixer.Sound(buffer=bytes(4))
+            self.banks[key] = self.render_variants(sound, variants)
+            for variant in self.banks[key]:
+                variant.set_volume(volumes.get(key, 1.0))
+
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), channels))
+        pygame.mixer.set_reserved(channels)
+        self.channels = [pygame.mixer.Channel(i) for i in range(channels)]
+        self.next_channel = 0
+        self.pending: List[str] = []
+
+    @staticmethod
+    def render_variants(sound: pygame.mixer.Sound, variants: int) -> List[pygame.mixer.Sound]:
+        low, high = PITCH_RANGE
+        if variants <= 1:
+            return [sound]
+        return [pitch_shift(sound, low + (high - low) * i / (variants - 1))
+                for i in range(variants)]
+
+    def play(self, key: str):
+        """Queue a sound for the next flush; repeats within a frame collapse"""
+        if key in self.pending:
+            self.pending.remove(key)
+        self.pending.append(key)
+
+    def play_now(self, key: str) -> pygame.mixer.Channel:
+        channel = self.channels[self.next_channel]
+        self.next_channel = (self.next_channel + 1) % len(self.channels)
+        channel.play(random.choice(self.banks[key]))
+        return channel
+
+    def flush(self):
+        capped = [key for key in self.pending if key not in self.one_shots]
+        for key in self.pending:
+            if key in self.one_shots:
+                self.play_now(key)
+        for key in capped[-MAX_PER_FRAME:]:
+            self.play_now(key)
+        self.pending.clear()
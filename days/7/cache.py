@@ -0,0 +1,217 @@
+import pickle
+import sys
+from collections import OrderedDict
+
+from solver import ANY, is_bounded
+
+MISSING = object()
+ROOT = -1  # parent of the node for a line's first operand
+
+
+class SearchCache:
+    """
+    LRU memo for the backward search. A sub-problem is "can these operands,
+    left to right, make this target": working backwards from the end of a
+    line, what is left is always a prefix of its operands. Keys are
+    (target, prefix id, operator symbols), so lines sharing operands, and
+    reruns over the same file, reuse each other's answers.
+
+    Prefixes are interned as a trie: the node (parent id, operand) is the
+    parent prefix plus one operand, so a line's ids cost one lookup per
+    operand and a key stays small however long the line is. A node lives
+    while an entry or a longer prefix uses it. Ids are never reused, so
+    entries can't outlive their node's meaning.
+
+    Eviction kicks in past max_entries or once the estimated size of the
+    entries and nodes passes max_bytes, whichever comes first.
+    """
+
+    def __init__(self, max_entries=1_000_000, max_bytes=256 << 20):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.prefixes = {}  # (parent id, operand) -> prefix id
+        self.nodes = {}  # prefix id -> [parent id, operand, references]
+        self.next_id = 0
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def entry_size(key):
+        return sys.getsizeof(key) + sys.getsizeof(key[0])
+
+    @staticmethod
+    def node_size(parent, operand):
+        # The trie key, the node list and the operand itself
+        return 2 * sys.getsizeof((parent, operand)) + sys.getsizeof(operand) + 8
+
+    def prefix_id(self, parent, operand):
+        """Id of the prefix parent + (operand,), adding its node if needed"""
+        pid = self.prefixes.get((parent, operand))
+        if pid is None:
+            pid = self.next_id
+            self.next_id += 1
+            self.prefixes[(parent, operand)] = pid
+            self.nodes[pid] = [parent, operand, 0]
+            self.bytes += self.node_size(parent, operand)
+            if parent != ROOT:
+                self.nodes[parent][2] += 1
+        return pid
+
+    def prefix_ids(self, numbers):
+        """ids[i] is the id of numbers[:i + 1]"""
+        ids = []
+        parent = ROOT
+        for number in numbers:
+            parent = self.prefix_id(parent, number)
+            ids.append(parent)
+        return ids
+
+    def hold(self, pid):
+        self.nodes[pid][2] += 1
+
+    def release(self, pid):
+        """Drop one reference to a node, removing it and any parents left unused"""
+        while pid != ROOT:
+            node = self.nodes[pid]
+            node[2] -= 1
+            if node[2]:
+                return
+            parent, operand, _ = node
+            del self.nodes[pid]
+            del self.prefixes[(parent, operand)]
+            self.bytes -= self.node_size(parent, operand)
+            pid = parent
+
+    def get(self, key):
+        result = self.entries.get(key, MISSING)
+        if result is MISSING:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.entries.move_to_end(key)
+        return result
+
+    def put(self, key, result):
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            return
+        self.entries[key] = result
+        self.hold(key[1])
+        self.bytes += self.entry_size(key)
+        while self.entries and (len(self.entries) > self.max_entries or self.bytes > self.max_bytes):
+            old_key, _ = self.entries.popitem(last=False)
+            self.bytes -= self.entry_size(old_key)
+            self.release(old_key[1])
+            self.evictions += 1
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "prefixes": len(self.nodes),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def save(self, path):
+        # Nodes are in id order, so every parent comes before its children
+        nodes = [(pid, parent, operand) for pid, (parent, operand, _) in self.nodes.items()]
+        with open(path, "wb") as file:
+            pickle.dump((nodes, list(self.entries.items())), file)
+
+    def load(self, path):
+        """Add entries saved by an earlier run, e.g. last night's"""
+        with open(path, "rb") as file:
+            nodes, entries = pickle.load(file)
+        ids = {ROOT: ROOT}
+        for pid, parent, operand in nodes:
+            ids[pid] = self.prefix_id(ids[parent], operand)
+        for (target, pid, symbols), result in entries:
+            self.put((target, ids[pid], symbols), result)
+
+    def search(self, test_value, numbers, operators):
+        """search_backward with every (target, operands) sub-problem memoized"""
+        symbols = tuple(op.symbol for op in operators)
+        ids = self.prefix_ids(numbers)
+        last = len(numbers) - 1
+        # Hold the line's nodes, so evictions during the search keep them
+        self.hold(ids[last])
+        try:
+            return self._search(test_value, numbers, operators, symbols, ids)
+        finally:
+            self.release(ids[last])
+
+    def _search(self, test_value, numbers, operators, symbols, ids):
+        """
+        Depth-first with an explicit stack like search_backward, so long
+        lines don't hit the recursion limit. A frame is [target, i, next
+        operator to try]; a finished frame hands its answer to its parent.
+        """
+        inverses = [op.inverse for op in operators]
+        floor = numbers[0] if is_bounded(operators, numbers) else None
+
+        last = len(numbers) - 1
+        answer = self.get((test_value, ids[last], symbols))
+        if answer is not MISSING:
+            return answer
+
+        stack = [[test_value, last, 0]]
+        answer = None  # from the frame that just finished
+        while stack:
+            frame = stack[-1]
+            target, i, k = frame
+            if answer is True:
+                result = True
+            elif i == 0:
+                result = target == numbers[0]
+            else:
+                result = False
+                while k < len(inverses):
+                    previous = inverses[k](target, numbers[i])
+                    k += 1
+                    if previous is None:
+                        continue
+                    if previous is ANY:
+                        result = True
+                        break
+                    if floor is not None and previous < floor:
+                        continue
+                    cached = self.get((previous, ids[i - 1], symbols))
+                    if cached is MISSING:
+                        frame[2] = k
+                        stack.append([previous, i - 1, 0])
+                        result = None
+                        break
+                    if cached:
+                        result = True
+                        break
+                if result is None:
+                    answer = None
+                    continue
+
+            self.put((target, ids[i], symbols), result)
+            stack.pop()
+            answer = result
+        return answer
+
+
+# Main logic
+if __name__ == "__main__":
+    import time
+
+    from solver import PART1, PART2, evaluate_lines
+
+    file_path = "input.txt"
+    cache = SearchCache()
+    # The second pass over each operator set is a rerun of the same file
+    for name, operators in (("+*", PART1), ("+*||", PART2), ("+*", PART1), ("+*||", PART2)):
+        start = time.perf_counter()
+        total = evaluate_lines(file_path, operators, cache=cache)
+        elapsed = time.perf_counter() - start
+        print(f"Total with {name}: {total} ({elapsed * 1000:.2f} ms) {cache.stats()}")
@@ -0,0 +1,59 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+
+from solver import (PART1, PART2, Operator, OperatorSet, read_equations, resolve_operators,
+                    search_backward, search_forward, sum_reachable)
+
+BATCHES_PER_WORKER = 8
+
+Equation = Tuple[int, List[int]]
+
+
+def _solve_batch(batch: Sequence[Equation], operators: Tuple[Operator, ...]) -> List[bool]:
+    search = search_backward if all(op.inverse for op in operators) else search_forward
+    return [search(test_value, numbers, operators) for test_value, numbers in batch]
+
+
+def schedule(equations: Sequence[Equation], workers: int) -> List[List[int]]:
+    """
+    Group line indices into batches, longest lines first, so the expensive
+    searches start early and the short ones fill in the gaps at the end.
+    """
+    order = sorted(range(len(equations)), key=lambda i: len(equations[i][1]), reverse=True)
+    batch_size = max(1, -(-len(order) // (workers * BATCHES_PER_WORKER)))
+    return [order[i:i + batch_size] for i in range(0, len(order), batch_size)]
+
+
+def evaluate_parallel(file_path, operators: OperatorSet = PART1,
+                      workers: Optional[int] = None, verbose=False):
+    """
+    Same total as solver.evaluate_lines, with the lines searched in a
+    process pool. The file is parsed once here and only the equations are
+    sent out. With verbose, lines are logged afterwards in file order.
+    """
+    operators = resolve_operators(operators)
+    equations = read_equations(file_path)
+    workers = workers or os.cpu_count() or 1
+    batches = schedule(equations, workers)
+
+    reachable = [False] * len(equations)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_solve_batch, [equations[i] for i in batch], operators)
+                   for batch in batches]
+        for batch, future in zip(batches, futures):
+            for i, hit in zip(batch, future.result()):
+                reachable[i] = hit
+
+    return sum_reachable(equations, reachable, operators, verbose)
+
+
+# Main logic
+if __name__ == "__main__":
+    file_path = "input.txt"
+    for name, operators in (("+*", PART1), ("+*||", PART2)):
+        start = time.perf_counter()
+        total = evaluate_parallel(file_path, operators)
+        elapsed = time.perf_counter() - start
+        print(f"Total with {name}: {total} ({elapsed * 1000:.2f} ms)")
@@ -0,0 +1,276 @@
+import operator
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import product
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+POWER_CACHE_SIZE = 1024
+
+# Returned by an inverse when every previous value gives the target (x * 0)
+ANY = object()
+
+
+@dataclass(frozen=True)
+class Operator:
+    """
+    A binary operator applied left to right. inverse(target, operand)
+    returns the only value that gives target, None if there is none, or
+    ANY; with an inverse for every operator, a set runs the backward
+    search. monotonic means forward(a, b) >= a whenever a >= 0 and b >= 1,
+    which lets the searches drop values that overshoot the target.
+    """
+    symbol: str
+    forward: Callable[[int, int], int]
+    inverse: Optional[Callable[[int, int], object]] = None
+    monotonic: bool = False
+
+
+OPERATORS: Dict[str, Operator] = {}
+
+
+def register_operator(op: Operator) -> Operator:
+    OPERATORS[op.symbol] = op
+    return op
+
+
+@lru_cache(maxsize=POWER_CACHE_SIZE)
+def digits_power(number):
+    """
+    10 ** (number of digits), the shift that makes room for number. The
+    cache is bounded: operands repeat a lot within and across files, but
+    long runs over many files must not grow it without limit.
+    """
+    return 10 ** len(str(abs(number)))
+
+
+def concat(p, number):
+    """
+    p || number, done arithmetically. For negative operands this is still
+    p * 10**digits + number (not string gluing), so undo_concat can invert
+    it exactly.
+    """
+    return p * digits_power(number) + number
+
+
+def undo_mul(target, number):
+    if number == 0:
+        return ANY if target == 0 else None
+    return target // number if target % number == 0 else None
+
+
+def undo_concat(target, number):
+    power = digits_power(number)
+    rest = target - number
+    return rest // power if rest % power == 0 else None
+
+
+ADD = register_operator(Operator("+", operator.add, operator.sub, True))
+MUL = register_operator(Operator("*", operator.mul, undo_mul, True))
+CONCAT = register_operator(Operator("||", concat, undo_concat, True))
+SUB = register_operator(Operator("-", operator.sub, operator.add))
+XOR = register_operator(Operator("^", operator.xor, operator.xor))
+
+PART1 = (ADD, MUL)
+PART2 = (ADD, MUL, CONCAT)
+
+OperatorSet = Union[str, Iterable[Union[str, Operator]]]
+
+
+def split_symbols(text: str) -> List[str]:
+    """
+    Split a string like "+*||" or "+ * ||" into registered symbols, taking
+    the longest match at each position.
+    """
+    symbols = []
+    i = 0
+    while i < len(text):
+        if text[i].isspace():
+            i += 1
+            continue
+        matches = [symbol for symbol in OPERATORS if text.startswith(symbol, i)]
+        if not matches:
+            raise KeyError(f"No registered operator at {text[i:]!r}")
+        symbol = max(matches, key=len)
+        symbols.append(symbol)
+        i += len(symbol)
+    return symbols
+
+
+def resolve_operators(operators: OperatorSet) -> Tuple[Operator, ...]:
+    """Operators or registered symbols; a plain string goes through split_symbols"""
+    if isinstance(operators, str):
+        operators = split_symbols(operators)
+    return tuple(op if isinstance(op, Operator) else OPERATORS[op] for op in operators)
+
+
+def parse_line(line):
+    """Split "target: a b c" into (target, [a, b, c])"""
+    test_value, numbers = line.split(":")
+    return int(test_value), [*map(int, numbers.split())]
+
+
+def read_equations(file_path):
+    with open(file_path, 'r') as file:
+        return [parse_line(line) for line in file if line.strip()]
+
+
+def is_bounded(operators, numbers):
+    """
+    True when no partial result can exceed the final one: every operator is
+    monotonic, the first operand is non-negative and the rest are at least 1.
+    """
+    return (all(op.monotonic for op in operators) and numbers[0] >= 0
+            and min(numbers[1:], default=1) >= 1)
+
+
+def search_backward(test_value, numbers, operators):
+    """
+    Works right to left from the target, undoing one operator per operand.
+    Each undo has to be exact, so most branches die on the first operand.
+    In a bounded set, partial results only grow from numbers[0], so
+    anything smaller can be dropped.
+
+    Different undo chains often meet in the same (target, i) state (with
+    operands of 1, "* 1 then + 1" and "+ 1 then * 1" do), so each state is
+    only expanded once.
+    """
+    inverses = [op.inverse for op in operators]
+    floor = numbers[0] if is_bounded(operators, numbers) else None
+    stack = [(test_value, len(numbers) - 1)]
+    visited = set(stack)
+    while stack:
+        target, i = stack.pop()
+        number = numbers[i]
+        if i == 0:
+            if target == number:
+                return True
+            continue
+
+        for inverse in inverses:
+            previous = inverse(target, number)
+            if previous is None:
+                continue
+            if previous is ANY:
+                return True
+            if (floor is None or previous >= floor) and (previous, i - 1) not in visited:
+                visited.add((previous, i - 1))
+                stack.append((previous, i - 1))
+    return False
+
+
+def search_forward(test_value, numbers, operators):
+    """
+    Left to right over the distinct values reachable so far, for operator
+    sets without inverses. With monotonic operators, non-negative values
+    above the target are dropped unless an operand below 1 is still to come.
+
+    Once the target is reachable and every remaining operand can leave it
+    unchanged under some operator (+ 0, * 1), the search stops.
+    """
+    forwards = [op.forward for op in operators]
+    monotonic = all(op.monotonic for op in operators)
+    # small_from[i]: an operand below 1 is at i or later
+    small_from = [False] * (len(numbers) + 1)
+    for i in range(len(numbers) - 1, -1, -1):
+        small_from[i] = small_from[i + 1] or numbers[i] < 1
+
+    possibles = {numbers[0]}
+    for i in range(1, len(numbers)):
+        if test_value in possibles and all(
+                any(f(test_value, n) == test_value for f in forwards) for n in numbers[i:]):
+            return True
+        curr = numbers[i]
+        prune = monotonic and not small_from[i + 1]
+        temp = set()
+        for p in possibles:
+            for f in forwards:
+                v = f(p, curr)
+                if not prune or v <= test_value or v < 0:
+                    temp.add(v)
+        if not temp:
+            return False
+        possibles = temp
+    return test_value in possibles
+
+
+def can_reach(test_value, numbers, operators: OperatorSet = PART1):
+    """
+    Whether some left-to-right mix of operators turns numbers into
+    test_value. Uses the backward search when every operator has an inverse.
+    """
+    operators = resolve_operators(operators)
+    if all(op.inverse for op in operators):
+        return search_backward(test_value, numbers, operators)
+    return search_forward(test_value, numbers, operators)
+
+
+def find_operators(test_value, numbers, operators: OperatorSet = PART1) -> Optional[List[str]]:
+    """One operator sequence that reaches test_value, for logging"""
+    operators = resolve_operators(operators)
+    if not all(op.inverse for op in operators):
+        for ops in product(operators, repeat=len(numbers) - 1):
+            value = numbers[0]
+            for op, number in zip(ops, numbers[1:]):
+                value = op.forward(value, number)
+            if value == test_value:
+                return [op.symbol for op in ops]
+        return None
+
+    def undo(target, i):
+        if i == 0:
+            return [] if target == numbers[0] else None
+        for op in operators:
+            previous = op.inverse(target, numbers[i])
+            if previous is ANY:
+                return [operators[0].symbol] * (i - 1) + [op.symbol]
+            if previous is not None:
+                rest = undo(previous, i - 1)
+                if rest is not None:
+                    return rest + [op.symbol]
+        return None
+
+    return undo(test_value, len(numbers) - 1)
+
+
+def sum_reachable(equations, reachable, operators, verbose=False):
+    """
+    Add up the targets of the reachable equations. With verbose, prints
+    each line and the expression found for it.
+    """
+    total = 0
+    for (test_value, numbers), hit in zip(equations, reachable):
+        if verbose:
+            print(f"Processing line: result={test_value}, elements={numbers}")
+        if hit:
+            if verbose:
+                ops = find_operators(test_value, numbers, operators)
+                expression = str(numbers[0]) + "".join(op + str(n) for op, n in zip(ops, numbers[1:]))
+                print(f"Found that {expression} evals to {test_value}, adding to total: {total}")
+            total += test_value
+    return total
+
+
+def evaluate_lines(file_path, operators: OperatorSet = PART1, verbose=False, cache=None):
+    """
+    Sum of the targets that some left-to-right mix of operators can
+    produce. PART1 gives main.py's total and PART2 main2.py's. cache is an
+    optional cache.SearchCache for the backward search.
+    """
+    operators = resolve_operators(operators)
+    search = search_backward if all(op.inverse for op in operators) else search_forward
+    if cache is not None and search is search_backward:
+        search = cache.search
+    equations = read_equations(file_path)
+    reachable = (search(test_value, numbers, operators) for test_value, numbers in equations)
+    return sum_reachable(equations, reachable, operators, verbose)
+
+
+# Main logic
+if __name__ == "__main__":
+    file_path = "input.txt"
+    for name, operators in (("+*", PART1), ("+*||", PART2)):
+        start = time.perf_counter()
+        total = evaluate_lines(file_path, operators)
+        elapsed = time.perf_counter() - start
+        print(f"Total with {name}: {total} ({elapsed * 1000:.2f} ms)")